@@ -5,15 +5,36 @@ st.set_page_config(
     layout="wide",
 )
 
-import pandas as pd
+import time
 import plotly.express as px
-from utils.data_loader import load_data
+from utils.browser import default_columns, render_browser
+from utils.diagnostics import render_load_panel
+from utils.editions import edition_status, edition_versions, load_edition
+from utils.export import render_export
+from utils.figure_cache import cached_figure
+from utils.timebins import heatmap_dia_hora
 
 # 2) Carregamento de dados
-# API 2025
-df_2025 = load_data(path=None)
+run_started = time.time()
+# API 2025 (atualizada em segundo plano; sempre a última versão boa)
+df_2025 = load_edition("2025")
 # CSV 2024 local
-df_2024 = load_data(path="./dados/2024.csv")
+df_2024 = load_edition("2024")
+
+# "Dados de": momento da última carga da API e quanto ela levou
+status = edition_status("2025")
+if status["as_of"] is not None:
+    st.sidebar.caption(
+        f"Dados da API de {status['as_of']:%d/%m/%Y %H:%M:%S}"
+        + (f" · atualização levou {status['last_duration_s']:.1f}s" if status["last_duration_s"] else "")
+        + (" · atualizando…" if status["refreshing"] else "")
+    )
+if status["last_error"]:
+    st.sidebar.warning(f"Última atualização falhou: {status['last_error']}")
+
+# Diagnóstico opcional: etapas de carga, acerto de cache e memória por edição
+if st.sidebar.checkbox("Mostrar diagnóstico de carga"):
+    render_load_panel({"2025": df_2025, "2024": df_2024}, run_started)
 
 # # 3) Cálculo de métricas comparativas
 # # Total de Inscrições
@@ -161,6 +182,26 @@ df_2024 = load_data(path="./dados/2024.csv")
 # st.subheader("Tabela de Inscrições Acumuladas")
 # st.dataframe(df_concat)
 
-# Exibir tabela completa raw da API
+# Inscrições por dia da semana × hora (2025), por contagem das chaves inteiras de createdAt_ms
+def build_fig_heatmap():
+    heat = heatmap_dia_hora(df_2025["createdAt_ms"].to_numpy())
+    fig = px.imshow(
+        heat,
+        labels={"x": "Hora", "y": "Dia da semana", "color": "Inscrições"},
+        color_continuous_scale="Blues",
+        aspect="auto",
+        title="Inscrições por Dia da Semana e Hora — 2025",
+    )
+    fig.update_xaxes(dtick=1)
+    return fig
+
+if "createdAt_ms" in df_2025.columns:
+    fig_heatmap = cached_figure("Visão Geral", "fig_heatmap", edition_versions(["2025"]), build_fig_heatmap)
+    st.plotly_chart(fig_heatmap, use_container_width=True)
+
+# Dados brutos da API, paginados no servidor (só a página visível vai ao navegador)
 st.subheader("Dados Brutos da API (2025)")
-st.dataframe(df_2025)
+(_, version_2025), = edition_versions(["2025"])
+query = render_browser("2025", version_2025, df_2025)
+# exportação das mesmas linhas (busca e ordenação do navegador), gerada em blocos
+render_export("2025", version_2025, query, list(df_2025.columns), default_columns(df_2025))
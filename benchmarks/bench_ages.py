@@ -0,0 +1,60 @@
+"""
+Compara o cálculo de idade/faixa vetorizado (utils/ages.py) com o caminho antigo
+de 01_Demografia.py (.dt.date + apply com lambda por linha).
+Uso: python benchmarks/bench_ages.py [n ...]   (padrão: 10000 100000 1000000)
+"""
+import gc
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.synthetic import make_birth_dates
+from utils.ages import AGE_BINS, AGE_LABELS, age_bands, compute_idade_anos
+
+START = pd.Timestamp('2025-06-12 08:00:00')
+
+
+def ages_lambda(births: pd.Series, start_timestamp: pd.Timestamp):
+    # caminho antigo (compute_idade de 01_Demografia.py), mantido como referência
+    births = pd.to_datetime(births, format='%d/%m/%Y', dayfirst=True, errors='coerce').dt.date
+    start_date = start_timestamp.date()
+    age_days = births.apply(lambda bd: (start_date - bd).days if pd.notnull(bd) else None)
+    anos = age_days / 365.25
+    idade = anos.fillna(0).astype(int)
+    return anos, idade, pd.cut(idade, bins=AGE_BINS, labels=AGE_LABELS, right=True)
+
+
+def ages_vector(births: pd.Series, start: pd.Timestamp):
+    anos = compute_idade_anos(births, start)
+    idade, faixa = age_bands(anos)
+    return anos, idade, faixa
+
+
+def _time(fn, *args, repeat: int = 3):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        out = None
+        gc.collect()
+        t0 = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main(sizes):
+    print(f"{'n':>10} {'lambda (s)':>11} {'vetor (s)':>10} {'ganho':>7}")
+    for n in sizes:
+        births = make_birth_dates(n)
+        t_old, a = _time(ages_lambda, births, START)
+        t_new, b = _time(ages_vector, births, START)
+        pd.testing.assert_series_equal(a[0].astype(float), b[0], check_names=False)
+        pd.testing.assert_series_equal(a[1], b[1], check_dtype=False)
+        pd.testing.assert_series_equal(a[2], b[2])
+        print(f"{n:>10} {t_old:>11.3f} {t_new:>10.3f} {t_old / t_new:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,58 @@
+"""
+Mede a vazão ponta a ponta da paginação (ParticipantsClient) contra a API simulada
+e confere que todos os participantes chegam exatamente uma vez.
+Uso: python benchmarks/bench_api_fetch.py --n 20000 --page-size 500 --latency 0.05 --error-rate 0.02
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.mock_api import MockParticipantsAPI
+from utils.api_client import ParticipantsClient
+
+
+def run(n: int, page_size: int, latency: float, error_rate: float, delay: float) -> dict:
+    api = MockParticipantsAPI(n, page_size, latency, error_rate)
+    server = api.serve()
+    try:
+        client = ParticipantsClient(server.url, "chave-local", delay=delay)
+        t0 = time.perf_counter()
+        participants, _, _, stats = client.fetch()
+        elapsed = time.perf_counter() - t0
+    finally:
+        server.shutdown()
+    if len(participants) != n:
+        raise AssertionError(f"paginação devolveu {len(participants)} participantes, esperado {n}")
+    lat = sorted(s["latency_s"] for s in stats.pages)
+    summary = stats.summary()
+    return {
+        "n": n,
+        "tempo_s": elapsed,
+        "participantes_por_s": n / elapsed,
+        "paginas": summary["pages"],
+        "requisicoes": api.requests,
+        "erros_injetados": api.errors,
+        "bytes": summary["bytes"],
+        "latencia_p50_s": statistics.median(lat),
+        "latencia_p95_s": lat[int(0.95 * (len(lat) - 1))],
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--n", type=int, nargs="+", default=[10_000])
+    ap.add_argument("--page-size", type=int, default=500)
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--delay", type=float, default=0.1, help="intervalo mínimo entre requisições do cliente")
+    a = ap.parse_args()
+    for n in a.n:
+        r = run(n, a.page_size, a.latency, a.error_rate, a.delay)
+        print("  ".join(f"{k}={v:.3f}" if isinstance(v, float) else f"{k}={v}" for k, v in r.items()))
+
+
+if __name__ == "__main__":
+    main()
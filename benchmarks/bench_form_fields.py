@@ -0,0 +1,43 @@
+"""
+Compara a expansão de formFields em lote (tabela longa + pivot) com o loop de load_data.
+Uso: python benchmarks/bench_form_fields.py [n ...]   (padrão: 10000 100000 1000000)
+"""
+import gc
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.synthetic import make_participants
+from utils.form_fields import expand_form_fields, form_fields_long, pivot_form_fields
+
+
+def expand_batch(form_fields: pd.Series) -> pd.DataFrame:
+    return pivot_form_fields(form_fields_long(form_fields), form_fields.index)
+
+
+def _time(fn, *args, repeat: int = 3):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        out = None
+        gc.collect()
+        t0 = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main(sizes):
+    print(f"{'n':>10} {'loop (s)':>10} {'lote (s)':>10} {'ganho':>7}")
+    for n in sizes:
+        ff = make_participants(n)["formFields"]
+        t_loop, a = _time(expand_form_fields, ff)
+        t_batch, b = _time(expand_batch, ff)
+        pd.testing.assert_frame_equal(a, b)
+        print(f"{n:>10} {t_loop:>10.3f} {t_batch:>10.3f} {t_loop / t_batch:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,121 @@
+"""
+Servidor local que imita o endpoint de participantes usado por load_data.
+
+Protocolo: POST com {"firstEmail": "<cursor>"}; resposta {"body": "<json>"} onde o JSON
+interno tem "participants" (ou "items") e "lastEmail" ("" na última página). Cada página
+começa no próprio cursor, então o último e-mail de uma página se repete na seguinte,
+como na API real. Latência, tamanho de página, taxa de erros e volume são configuráveis.
+
+Uso: python benchmarks/mock_api.py --port 8765 --n 20000 --page-size 500 --latency 0.05
+(em .streamlit/secrets.toml: URL = "http://127.0.0.1:8765", API_KEY = qualquer valor)
+"""
+import argparse
+import bisect
+import gzip
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.synthetic import make_participants
+
+
+class MockParticipantsAPI:
+    def __init__(self, n: int = 10_000, page_size: int = 500, latency: float = 0.0,
+                 error_rate: float = 0.0, key: str = "participants", seed: int = 0):
+        df = make_participants(n, seed=seed).sort_values("email")
+        df["createdAt"] = df["createdAt"].astype(int)
+        self.participants = df.to_dict("records")
+        self.emails = [p["email"] for p in self.participants]
+        self.page_size = page_size
+        self.latency = latency
+        self.error_rate = error_rate
+        self.key = key
+        self._rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+
+    def upsert(self, participant: dict) -> None:
+        """Inclui ou substitui (pelo e-mail) um participante, mantendo a ordem por e-mail."""
+        i = bisect.bisect_left(self.emails, participant["email"])
+        if i < len(self.emails) and self.emails[i] == participant["email"]:
+            self.participants[i] = participant
+        else:
+            self.emails.insert(i, participant["email"])
+            self.participants.insert(i, participant)
+
+    def page(self, first: str) -> dict:
+        # a página inclui o próprio cursor (gera o e-mail duplicado entre páginas)
+        i = bisect.bisect_left(self.emails, first) if first else 0
+        batch = self.participants[i:i + self.page_size]
+        last = batch[-1]["email"] if i + self.page_size < len(self.participants) else ""
+        return {self.key: batch, "lastEmail": last}
+
+    def handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                n = int(self.headers.get("Content-Length") or 0)
+                first = json.loads(self.rfile.read(n) or b"{}").get("firstEmail", "")
+                api.requests += 1
+                if api.latency:
+                    time.sleep(api.latency)
+                if api._rng.random() < api.error_rate:
+                    api.errors += 1
+                    self._send(500, b'{"message": "erro injetado"}')
+                    return
+                env = {"statusCode": 200, "body": json.dumps(api.page(first))}
+                self._send(200, json.dumps(env).encode("utf-8"))
+
+            def _send(self, code: int, data: bytes):
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                    data = gzip.compress(data, compresslevel=5)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """Sobe o servidor numa thread daemon e retorna-o (URL em `server.url`)."""
+        server = ThreadingHTTPServer((host, port), self.handler())
+        server.url = f"http://{host}:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--n", type=int, default=10_000)
+    ap.add_argument("--page-size", type=int, default=500)
+    ap.add_argument("--latency", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--key", choices=["participants", "items"], default="participants")
+    a = ap.parse_args()
+    api = MockParticipantsAPI(a.n, a.page_size, a.latency, a.error_rate, a.key)
+    server = api.serve(a.host, a.port)
+    print(f"API simulada em {server.url} ({a.n} participantes, páginas de {a.page_size})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Suíte de benchmarks do dashboard: cronometra cada etapa de build_data (API e CSV) e o
+bloco de cálculo de cada página sobre participantes sintéticos (benchmarks/synthetic.py).
+
+Uso:
+  python benchmarks/run.py --n 10000 100000 1000000
+  python benchmarks/run.py --n 10000 100000 --save       # grava benchmarks/baseline.json
+  python benchmarks/run.py --n 10000 100000 --compare    # compara com o baseline salvo
+
+O baseline deve ser gravado no ambiente fixado em requirements.txt; as versões usadas
+ficam registradas junto dos números e o --compare avisa quando o ambiente atual difere.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.synthetic import make_csv_frame, make_participants
+from utils.csv_reader import read_csv_typed
+from utils.data_loader import NORMALIZE_STAGES
+from utils.metrics import MetricsCube
+from utils.prepare import (START_2024, START_2025, derive_demografia, derive_educacao,
+                           derive_geografico)
+from utils.tags import TagIndex
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def _environment() -> dict:
+    try:
+        import pyarrow
+        arrow = pyarrow.__version__
+    except ImportError:
+        arrow = None
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "pyarrow": arrow,
+        "machine": platform.machine(),
+    }
+
+
+def _timed(results: dict, name: str, fn, *args):
+    gc.collect()
+    t0 = time.perf_counter()
+    out = fn(*args)
+    results[name] = time.perf_counter() - t0
+    return out
+
+
+def _normalize(results: dict, prefix: str, df: pd.DataFrame) -> pd.DataFrame:
+    for stage_name, stage in NORMALIZE_STAGES:
+        df = _timed(results, f"{prefix}.{stage_name}", stage, df)
+    return df
+
+
+def _page_educacao(df: pd.DataFrame):
+    derive_educacao(df)
+    return TagIndex.from_series(df['Temas de interesse']).counts()
+
+
+def _page_profissional(df: pd.DataFrame):
+    area = df['Qual a principal área de de atuação'].dropna().astype(str).str.strip()
+    return area.value_counts(normalize=True)
+
+
+def run(n: int) -> dict:
+    results = {}
+    raw_api = make_participants(n, seed=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "edicao.csv")
+        make_csv_frame(n, seed=2).to_csv(csv_path, sep=";", index=False)
+
+        # build_data via API (sem rede: a partir dos registros já paginados)
+        records = raw_api.to_dict("records")
+        df25 = _timed(results, "api.frame", pd.DataFrame, records)
+        df25 = _normalize(results, "api", df25)
+
+        # build_data via CSV
+        df24 = _timed(results, "csv.read", read_csv_typed, csv_path)
+        df24 = _normalize(results, "csv", df24)
+
+    # blocos de cálculo das páginas (colunas derivadas + o que ainda é feito por linha)
+    _timed(results, "page.demografia", derive_demografia, df25, START_2025)
+    derive_demografia(df24, START_2024)
+    _timed(results, "page.geografico", derive_geografico, df25)
+    derive_geografico(df24)
+    _timed(results, "page.educacao", _page_educacao, df25)
+    derive_educacao(df24)
+    _timed(results, "page.profissional", _page_profissional, df25)
+    _timed(results, "cube.build", MetricsCube, {"2024": df24, "2025": df25})
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmarks do carregamento e das páginas")
+    ap.add_argument("--n", type=int, nargs="+", default=[10_000, 100_000])
+    ap.add_argument("--save", action="store_true", help="grava os resultados como baseline")
+    ap.add_argument("--compare", action="store_true", help="compara com o baseline salvo")
+    a = ap.parse_args()
+
+    baseline = {}
+    env = _environment()
+    if a.compare and os.path.exists(BASELINE):
+        with open(BASELINE, encoding="utf-8") as f:
+            saved = json.load(f)
+        baseline = saved["results"]
+        diff = {k: (saved.get(k), v) for k, v in env.items() if saved.get(k) != v}
+        if diff:
+            print("aviso: ambiente diferente do baseline (baseline -> atual): "
+                  + ", ".join(f"{k} {old} -> {new}" for k, (old, new) in diff.items()))
+
+    all_results = {}
+    for n in a.n:
+        res = run(n)
+        all_results[str(n)] = res
+        print(f"\nn = {n}")
+        for name, t in res.items():
+            ref = baseline.get(str(n), {}).get(name)
+            cmp = f"  ({t / ref:5.2f}x do baseline)" if ref else ("  (sem baseline)" if baseline else "")
+            print(f"  {name:<22} {t:9.3f} s{cmp}")
+
+    if a.save:
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump({**env, "results": all_results}, f, indent=2)
+        print(f"\nbaseline gravado em {BASELINE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Gerador de participantes sintéticos no formato do endpoint da API (formFields) e do CSV."""
+import numpy as np
+import pandas as pd
+
+# (UF, cidades, peso relativo) — distribuição concentrada em PE, como nas edições reais
+ESTADOS = [
+    ("PE", ["Recife", "Olinda", "Jaboatão dos Guararapes", "Caruaru", "Petrolina", "Paulista"], 40),
+    ("PB", ["João Pessoa", "Campina Grande"], 8),
+    ("SP", ["São Paulo", "Campinas", "Santos"], 8),
+    ("CE", ["Fortaleza", "Sobral"], 6),
+    ("BA", ["Salvador", "Feira de Santana"], 6),
+    ("AL", ["Maceió", "Arapiraca"], 5),
+    ("RN", ["Natal", "Mossoró"], 5),
+    ("RJ", ["Rio de Janeiro", "Niterói"], 5),
+    ("MG", ["Belo Horizonte", "Uberlândia"], 4),
+    ("DF", ["Brasília"], 3),
+    ("PR", ["Curitiba"], 2),
+    ("RS", ["Porto Alegre"], 2),
+    ("SE", ["Aracaju"], 2),
+    ("PI", ["Teresina"], 2),
+    ("MA", ["São Luís"], 2),
+]
+PAISES = [("Brasil", 97), ("Portugal", 1), ("Argentina", 1), ("Estados Unidos", 1)]
+GENEROS = [("Homem cis", 52), ("Mulher cis", 40), ("Mulher trans", 2), ("Homem trans", 1),
+           ("Não-binário", 2), ("Prefiro não informar", 3)]
+ESCOLARIDADES = [
+    ("Ensino médio completo", 10), ("Ensino médio em andamento", 6),
+    ("Ensino superior em andamento", 30), ("Ensino superior completo", 24),
+    ("Pós graduação completa", 14), ("Pós graduação em andamento", 6),
+    ("Mestrado", 6), ("Doutorado", 4),
+]
+AREAS = [("Tecnologia da Informação", 45), ("Educação", 15), ("Pesquisa e desenvolvimento", 8),
+         ("Consultoria", 6), ("Administração", 8), ("Engenharia", 8), ("Saúde", 5), ("Direito", 5)]
+TEMAS = ["Inteligência Artificial", "Cloud", "Segurança da Informação", "Ciência de Dados",
+         "Startups", "Games", "Blockchain", "UX/UI", "Desenvolvimento Web", "Mobile",
+         "IoT", "Inovação", "Educação", "Carreira", "DevOps"]
+EDICOES = ["2017", "2018", "2019", "2021", "2022", "2023", "2024"]
+TIPOS_INGRESSO = [("Gratuito", 80), ("Estudante", 15), ("Convidado", 5)]
+STATUS_EMAIL = [("Confirmado", 70), ("Pendente", 30)]
+
+
+def _pick(rng, pairs, n):
+    labels, weights = zip(*pairs)
+    w = np.array(weights, dtype=float)
+    return rng.choice(np.array(labels, dtype=object), n, p=w / w.sum())
+
+
+def make_birth_dates(n: int, seed: int = 0, invalid_frac: float = 0.02) -> pd.Series:
+    """'Data de nascimento' em texto dd/mm/aaaa (1950–2010), com uma fração vazia ou inválida."""
+    rng = np.random.default_rng(seed)
+    days = rng.integers(0, 60 * 365, n)
+    births = (pd.Timestamp("1950-01-01") + pd.to_timedelta(days, unit="D")).strftime("%d/%m/%Y")
+    births = pd.Series(births, dtype=object)
+    bad = rng.random(n) < invalid_frac
+    births[bad] = rng.choice(["", "31/02/1990", None], bad.sum())
+    return births
+
+
+def make_answers(n: int, seed: int = 0, start: pd.Timestamp = pd.Timestamp("2025-06-12 08:00:00"),
+                 days: int = 90) -> pd.DataFrame:
+    """Respostas do formulário (uma linha por participante) com nomes do header desejado."""
+    rng = np.random.default_rng(seed)
+    uf_idx = _pick(rng, [(i, w) for i, (_, _, w) in enumerate(ESTADOS)], n).astype(int)
+    estados = np.array([e[0] for e in ESTADOS], dtype=object)[uf_idx]
+    cidades = np.array([rng.choice(ESTADOS[i][1]) for i in uf_idx], dtype=object)
+    n_temas = rng.integers(0, 5, n)
+    temas = [", ".join(rng.choice(TEMAS, k, replace=False)) if k else None for k in n_temas]
+    n_ed = rng.choice([0, 0, 0, 1, 1, 2, 3, 4, 5], n)
+    edicoes = [", ".join(sorted(rng.choice(EDICOES, k, replace=False))) if k else None for k in n_ed]
+    created = start + pd.to_timedelta(np.sort(rng.integers(0, days * 86400, n)), unit="s")
+
+    def sim_nao(p_sim):
+        return np.where(rng.random(n) < p_sim, "Sim", "Não").astype(object)
+
+    return pd.DataFrame({
+        "Email": [f"participante{i:07d}@exemplo.com" for i in range(n)],
+        "Tipo de ingresso": _pick(rng, TIPOS_INGRESSO, n),
+        "Nome": [f"Participante {i}" for i in range(n)],
+        "Status do E-mail": _pick(rng, STATUS_EMAIL, n),
+        "Data Inscrição": created.strftime("%d/%m/%Y"),
+        "País": _pick(rng, PAISES, n),
+        "Estado": estados,
+        "Cidade": cidades,
+        "CPF": [f"{x:011d}" for x in rng.integers(0, 10**11, n)],
+        "Data de nascimento": make_birth_dates(n, seed).to_numpy(),
+        "Com qual gênero você se identifica?": _pick(rng, GENEROS, n),
+        "Participou de algum RNP anterior? Se sim, quais as edições?": edicoes,
+        "Escolaridade": _pick(rng, ESCOLARIDADES, n),
+        "Temas de interesse": temas,
+        "Qual a principal área de de atuação": _pick(rng, AREAS, n),
+        "Você é professor?": sim_nao(0.15),
+        "Em que empresa trabalha": _pick(rng, [("Empresa privada", 60), ("Órgão público", 15),
+                                               ("Universidade", 15), ("Autônomo", 10)], n),
+        "Trabalha com tecnologia": sim_nao(0.55),
+        "A empresa que você trabalha faz parte do Porto DIgital": sim_nao(0.25),
+        "Você desenvolve alguma atividade empresarial?": sim_nao(0.2),
+        "createdAt": created.as_unit("ms").asi8 + 3 * 3600 * 1000,   # ms UTC (horário de Brasília + 3h)
+    })
+
+
+def make_participants(n: int, seed: int = 0) -> pd.DataFrame:
+    """
+    DataFrame bruto com `email`, `createdAt` (ms) e `formFields`, como o da API antes do passo 2.
+    "Temas de interesse" vem como lista, os demais campos como texto.
+    """
+    answers = make_answers(n, seed)
+    cols = [c for c in answers.columns if c not in ("Email", "createdAt")]
+    values = answers[cols].to_numpy()
+    temas_i = cols.index("Temas de interesse")
+    forms = []
+    for row in values:
+        fields = []
+        for j, c in enumerate(cols):
+            v = row[j]
+            if pd.isna(v):
+                continue
+            fields.append({"id": c, "value": v.split(", ") if j == temas_i else v})
+        forms.append(fields)
+    return pd.DataFrame({
+        "email": answers["Email"],
+        "createdAt": answers["createdAt"],
+        "formFields": forms,
+    })
+
+
+def make_csv_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    """Equivalente ao export CSV histórico (colunas planas, sem formFields)."""
+    return make_answers(n, seed, start=pd.Timestamp("2024-07-04 17:30:00")).drop(columns=["createdAt"])
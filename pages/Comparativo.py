@@ -0,0 +1,118 @@
+import streamlit as st
+# 1) Configuração de página
+st.set_page_config(
+    page_title="Comparativo - Dashboard de Inscrições RNP 2025",
+    layout="wide",
+)
+
+import plotly.express as px
+from utils.daily import load_daily
+from utils.editions import EDITIONS, edition_versions
+from utils.figure_cache import cached_figure
+
+PAGE = "Comparativo"
+ANOS = sorted(EDITIONS)
+ATUAL, ANTERIOR = ANOS[-1], ANOS[-2]
+
+# 2) Carregamento: séries diárias por edição (persistidas em dados/.daily, inscrições só dos
+#    dias novos são acrescentadas, confirmados recontados), já alinhadas em "dias desde o início" de cada edição
+daily = load_daily(ANOS)
+versions = edition_versions(ANOS)
+cores = {'2024': 'blue', '2025': 'red'}
+
+st.title("Comparativo entre Edições")
+
+# 3) Cards: total, confirmados, taxa de confirmação e média diária da edição atual
+#    vs a anterior no mesmo ponto da campanha (mesmo nº de dias desde o início)
+atual = daily[daily['ano'] == ATUAL]
+dia_atual = atual['dias_desde_inicio'].max()
+ant = daily[(daily['ano'] == ANTERIOR) & (daily['dias_desde_inicio'] <= dia_atual)]
+
+tot_at, tot_ant = atual['inscricoes'].sum(), ant['inscricoes'].sum()
+conf_at, conf_ant = atual['confirmados'].sum(), ant['confirmados'].sum()
+tax_at = conf_at / tot_at * 100 if tot_at else None
+tax_ant = conf_ant / tot_ant * 100 if tot_ant else None
+med_at = tot_at / len(atual) if len(atual) else None
+med_ant = tot_ant / len(ant) if len(ant) else None
+
+def delta(a, b):
+    return f"{(a - b) / b * 100:+.1f}% vs {ANTERIOR}" if a is not None and b else "—"
+
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("Total de Inscrições", f"{tot_at:,}", delta(tot_at, tot_ant))
+c2.metric("E-mails Confirmados", f"{conf_at:,}", delta(conf_at, conf_ant))
+c3.metric("Taxa de Confirmação",
+          f"{tax_at:.1f}%" if tax_at is not None else "—",
+          f"{tax_at - tax_ant:+.1f} p.p. vs {ANTERIOR}" if tax_at is not None and tax_ant is not None else "—")
+c4.metric("Inscrições por Dia",
+          f"{med_at:.1f}" if med_at is not None else "—",
+          delta(med_at, med_ant))
+st.caption(f"Edição anterior considerada até o dia {dia_atual} desde o início, como a atual.")
+
+
+# 4) Inscrições acumuladas por dias desde o início
+def build_fig_acumulado():
+    fig = px.line(
+        daily,
+        x='dias_desde_inicio',
+        y='inscricoes_acumuladas',
+        color='ano',
+        color_discrete_map=cores,
+        labels={
+            'dias_desde_inicio': 'Dias desde Início',
+            'inscricoes_acumuladas': 'Total de Inscrições',
+            'ano': 'Ano'
+        },
+        title="Comparativo de Inscrições Acumuladas"
+    )
+    # eixo X até o último dia da edição atual
+    fig.update_xaxes(range=[-2, dia_atual])
+    return fig
+
+fig_acumulado = cached_figure(PAGE, "fig_acumulado", versions, build_fig_acumulado)
+st.plotly_chart(fig_acumulado, use_container_width=True)
+
+
+# 5) Inscrições por mês relativo ao início
+def build_fig_mensal():
+    mensal = daily.groupby(['ano', 'mes_relativo'], as_index=False)['inscricoes'].sum()
+    return px.bar(
+        mensal,
+        x='mes_relativo',
+        y='inscricoes',
+        color='ano',
+        barmode='group',
+        color_discrete_map=cores,
+        labels={
+            'mes_relativo': 'Mês relativo ao início',
+            'inscricoes': 'Inscrições',
+            'ano': 'Ano'
+        },
+        title='Inscrições por Mês Relativo ao Início'
+    )
+
+
+# 6) Taxa de confirmação acumulada por dias desde o início
+def build_fig_confirmacao():
+    fig = px.line(
+        daily,
+        x='dias_desde_inicio',
+        y='taxa_confirmacao',
+        color='ano',
+        color_discrete_map=cores,
+        labels={
+            'dias_desde_inicio': 'Dias desde Início',
+            'taxa_confirmacao': '% Confirmados',
+            'ano': 'Ano'
+        },
+        title='Taxa de Confirmação Acumulada'
+    )
+    fig.update_xaxes(range=[-2, dia_atual])
+    fig.update_yaxes(range=[0, 100], ticksuffix='%')
+    return fig
+
+col1, col2 = st.columns(2)
+with col1:
+    st.plotly_chart(cached_figure(PAGE, "fig_mensal", versions, build_fig_mensal), use_container_width=True)
+with col2:
+    st.plotly_chart(cached_figure(PAGE, "fig_confirmacao", versions, build_fig_confirmacao), use_container_width=True)
@@ -0,0 +1,18 @@
+import pytest
+
+from utils.schema import DESIRED_COLUMNS
+
+
+@pytest.fixture
+def write_csv():
+    """Grava um CSV de inscritos no formato do export oficial com `n` linhas."""
+    def write(path, n):
+        row = {c: "" for c in DESIRED_COLUMNS}
+        row.update({"Data Inscrição": "05/07/2025 10:00", "Data de nascimento": "01/01/1990",
+                    "Estado": "PE", "Status do E-mail": "Confirmado"})
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(";".join(f'"{c}"' for c in DESIRED_COLUMNS) + "\n")
+            for i in range(n):
+                f.write(";".join(f'"{i}@x"' if c == "Email" else f'"{row[c]}"' for c in DESIRED_COLUMNS) + "\n")
+
+    return write
@@ -0,0 +1,63 @@
+import os
+
+import pandas as pd
+import pytest
+
+from utils import daily as daily_mod
+
+
+@pytest.fixture(autouse=True)
+def daily_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(daily_mod, "DAILY_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _frame(days):
+    # uma linha por inscrição; dias ímpares confirmados
+    return pd.DataFrame({
+        "data": pd.to_datetime(days),
+        "Status do E-mail": ["Confirmado" if i % 2 else "Pendente" for i in range(len(days))],
+    })
+
+
+DAYS = ["2025-06-12", "2025-06-12", "2025-06-13", "2025-06-14", "2025-06-14"]
+
+
+def _full(df):
+    # série recalculada do zero, para comparação
+    out = daily_mod._count_days(df)
+    out["confirmados"] = out["data"].map(daily_mod._confirmed_by_day(df)).fillna(0).astype("int64")
+    return out
+
+
+def test_update_daily_appends_only_rows_past_watermark(daily_dir, monkeypatch):
+    daily_mod.update_daily("2025", _frame(DAYS))
+    seen = []
+    count = daily_mod._count_days
+    monkeypatch.setattr(daily_mod, "_count_days", lambda df: seen.append(len(df)) or count(df))
+
+    df = _frame(DAYS + ["2025-06-15", "2025-06-15"])
+    out = daily_mod.update_daily("2025", df)
+    # só o último dia salvo (14) e o novo (15) são recontados
+    assert seen == [4]
+    assert out["inscricoes"].tolist() == [2, 1, 2, 2]
+    assert out.equals(_full(df))
+    assert not [n for n in os.listdir(daily_dir) if n.endswith(".tmp")]
+
+
+def test_update_daily_counts_late_confirmations():
+    df = _frame(DAYS)
+    df["Status do E-mail"] = "Pendente"
+    daily_mod.update_daily("2025", df)
+    # inscrições dos dias 12 e 13 confirmadas depois do dia
+    df["Status do E-mail"] = ["Confirmado"] * 3 + ["Pendente"] * 2
+    df = pd.concat([df, _frame(["2025-06-15"])], ignore_index=True)
+    out = daily_mod.update_daily("2025", df)
+    assert out["confirmados"].tolist() == [2, 1, 0, 0]
+    assert out.equals(_full(df))
+
+
+def test_update_daily_recounts_when_older_rows_change():
+    daily_mod.update_daily("2025", _frame(DAYS))
+    out = daily_mod.update_daily("2025", _frame(DAYS[1:]))
+    assert out["inscricoes"].tolist() == [1, 1, 2]
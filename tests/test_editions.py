@@ -0,0 +1,23 @@
+import pandas as pd
+import pytest
+
+from utils import editions, snapshot
+
+
+@pytest.fixture
+def csv_editions(tmp_path, monkeypatch, write_csv):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    registry = {}
+    for ano, n in (("2023", 2), ("2024", 3)):
+        path = str(tmp_path / f"{ano}.csv")
+        write_csv(path, n)
+        registry[ano] = {"fonte": "csv", "path": path, "start": pd.Timestamp(f"{ano}-07-01")}
+    monkeypatch.setattr(editions, "EDITIONS", registry)
+    return registry
+
+
+def test_load_combined_tags_rows_with_ano(csv_editions):
+    combined = editions.load_combined()
+    assert combined["ano"].value_counts().to_dict() == {"2024": 3, "2023": 2}
+    assert set(editions.load_edition("2024").columns) <= set(combined.columns)
+    assert editions.load_combined(["2023"])["ano"].unique().tolist() == ["2023"]
@@ -0,0 +1,40 @@
+import os
+
+import pandas as pd
+import pytest
+
+from utils import browser, export
+
+QUERY = {"search": "", "search_columns": ["Email"], "sort_by": None, "ascending": True}
+
+
+@pytest.fixture(autouse=True)
+def edition(tmp_path, monkeypatch):
+    df = pd.DataFrame({"Email": ["b@x", "a@x"], "Nome": ["B", "A"]})
+    monkeypatch.setattr(export, "EXPORT_DIR", str(tmp_path))
+    monkeypatch.setattr(export, "load_edition", lambda ano: df)
+    monkeypatch.setattr(browser, "load_edition", lambda ano: df)
+    return df
+
+
+def test_read_export_rebuilds_pruned_file(monkeypatch):
+    real, paths = export.export_file, []
+
+    def pruned_once(*args):
+        # simula outra sessão removendo o arquivo (_prune) antes da leitura
+        path = real(*args)
+        paths.append(path)
+        if len(paths) == 1:
+            os.remove(path)
+        return path
+
+    monkeypatch.setattr(export, "export_file", pruned_once)
+    data = export.read_export("2025", "v1", QUERY, ["Email"], "CSV")
+    assert data.decode("utf-8-sig").splitlines() == ["Email", "b@x", "a@x"]
+    assert len(paths) == 2
+
+
+def test_export_key_changes_with_query():
+    sorted_query = dict(QUERY, sort_by="Email")
+    assert export.export_key("v1", QUERY, ["Email"], "CSV") != export.export_key("v1", sorted_query, ["Email"], "CSV")
+    assert export.export_key("v1", QUERY, ["Email"], "CSV") == export.export_key("v1", dict(QUERY), ["Email"], "CSV")
@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+from utils import prepare, snapshot
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+
+
+def test_csv_change_reloads_with_new_version(tmp_path, write_csv):
+    path = str(tmp_path / "inscritos.csv")
+    write_csv(path, 3)
+    before = prepare.data_version(path)
+    assert len(prepare.load_shared(path)) == 3
+
+    write_csv(path, 5)
+    os.utime(path, (os.path.getmtime(path) + 5,) * 2)
+    assert prepare.data_version(path) != before
+    assert len(prepare.load_shared(path)) == 5
@@ -0,0 +1,35 @@
+import itertools
+
+from utils.refresher import BackgroundRefresher
+
+
+def test_get_returns_first_value():
+    r = BackgroundRefresher(lambda: 1, interval=60, name="teste-get")
+    try:
+        assert r.get(timeout=5) == 1
+    finally:
+        r.stop()
+
+
+def test_stop_ends_thread():
+    r = BackgroundRefresher(lambda: 1, interval=60, name="teste-stop")
+    r.get(timeout=5)
+    r.stop()
+    r._thread.join(timeout=5)
+    assert not r._thread.is_alive()
+    # o último valor continua legível depois de parado
+    assert r.get() == 1
+
+
+def test_same_name_replaces_previous_instance():
+    counter = itertools.count()
+    first = BackgroundRefresher(lambda: next(counter), interval=60, name="teste-nome")
+    first.get(timeout=5)
+    second = BackgroundRefresher(lambda: next(counter), interval=60, name="teste-nome")
+    try:
+        first._thread.join(timeout=5)
+        assert first.stopped and not first._thread.is_alive()
+        assert not second.stopped
+        assert second.get(timeout=5) >= 1
+    finally:
+        second.stop()
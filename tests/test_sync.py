@@ -0,0 +1,128 @@
+import copy
+import os
+
+import pytest
+
+from benchmarks.mock_api import MockParticipantsAPI
+from utils import data_loader
+from utils.api_client import ParticipantsClient
+
+
+@pytest.fixture
+def api():
+    api = MockParticipantsAPI(n=1200, page_size=200)
+    api.server = api.serve()
+    yield api
+    api.server.shutdown()
+
+
+@pytest.fixture
+def client(api):
+    return ParticipantsClient(api.server.url, "chave-local", delay=0)
+
+
+@pytest.fixture(autouse=True)
+def sync_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, "SYNC_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _participant(api, email, status=None):
+    g = copy.deepcopy(api.participants[0])
+    g["email"] = email
+    if status is not None:
+        _set_status(g, status)
+    return g
+
+
+def _set_status(g, status):
+    fields = [f for f in g["formFields"] if f["id"] != "Status do E-mail"]
+    g["formFields"] = fields + [{"id": "Status do E-mail", "value": status}]
+
+
+def _status(g):
+    return next(f["value"] for f in g["formFields"] if f["id"] == "Status do E-mail")
+
+
+def _by_email(participants):
+    return {g["email"]: g for g in participants}
+
+
+def test_first_sync_is_full(api, client):
+    participants, stats = data_loader.sync_participants(client)
+    assert len(participants) == len(api.participants)
+    assert stats.summary()["pages"] > 1
+
+
+def test_incremental_sync_resumes_from_cursor(api, client):
+    data_loader.sync_participants(client)
+    api.upsert(_participant(api, "zzzz.new@example.com"))
+    participants, stats = data_loader.sync_participants(client)
+    assert "zzzz.new@example.com" in _by_email(participants)
+    assert len(participants) == len(api.participants)
+    # só a última página é reconsultada
+    assert stats.summary()["pages"] == 1
+
+
+def test_full_sync_sees_new_head_emails_and_status_changes(api, client):
+    data_loader.sync_participants(client)
+    changed = copy.deepcopy(api.participants[10])
+    _set_status(changed, "Alterado")
+    api.upsert(changed)
+    api.upsert(_participant(api, "aaaa.new@example.com"))
+    api.upsert(_participant(api, "zzzz.new@example.com"))
+
+    # entre paginações completas, só o que ordena depois do cursor aparece
+    participants, _ = data_loader.sync_participants(client)
+    by_email = _by_email(participants)
+    assert "zzzz.new@example.com" in by_email
+    assert "aaaa.new@example.com" not in by_email
+
+    participants, _ = data_loader.sync_participants(client, full_every=0)
+    by_email = _by_email(participants)
+    assert "aaaa.new@example.com" in by_email
+    assert "zzzz.new@example.com" in by_email
+    assert _status(by_email[changed["email"]]) == "Alterado"
+    assert len(participants) == len(api.participants)
+
+
+def test_corrupt_state_falls_back_to_full_sync(api, client, sync_dir):
+    data_loader.sync_participants(client)
+    state_file, _ = data_loader._sync_files()
+    with open(state_file, "w", encoding="utf-8") as f:
+        f.write("{corrompido")
+    participants, stats = data_loader.sync_participants(client)
+    assert len(participants) == len(api.participants)
+    assert stats.summary()["pages"] > 1
+
+
+def test_truncated_participants_file_falls_back_to_full_sync(api, client):
+    data_loader.sync_participants(client)
+    _, participants_file = data_loader._sync_files()
+    with open(participants_file, "a", encoding="utf-8") as f:
+        f.write('{"email": "parcial')
+    participants, _ = data_loader.sync_participants(client)
+    assert len(participants) == len(api.participants)
+
+
+def test_sync_leaves_no_temporary_files(api, client, sync_dir):
+    data_loader.sync_participants(client)
+    api.upsert(_participant(api, "zzzz.new@example.com"))
+    data_loader.sync_participants(client)
+    assert not [n for n in os.listdir(sync_dir) if n.endswith(".tmp")]
+
+
+def test_editions_keep_separate_state(api, client):
+    other = MockParticipantsAPI(n=300, page_size=200, seed=1)
+    other.server = other.serve()
+    try:
+        other_client = ParticipantsClient(other.server.url, "chave-local", delay=0)
+        data_loader.sync_participants(client, "2025")
+        data_loader.sync_participants(other_client, "2026")
+        api.upsert(_participant(api, "zzzz.new@example.com"))
+        participants, _ = data_loader.sync_participants(client, "2025")
+        assert len(participants) == len(api.participants)
+        participants, _ = data_loader.sync_participants(other_client, "2026")
+        assert len(participants) == len(other.participants)
+    finally:
+        other.server.shutdown()
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from utils.timebins import parse_day, time_keys
+
+
+def test_parse_day_explicit_format():
+    s = pd.Series(["05/07/2024", "31/12/2024 23:59:59", "05/07/2024"])
+    assert parse_day(s).tolist() == [pd.Timestamp("2024-07-05"), pd.Timestamp("2024-12-31"),
+                                     pd.Timestamp("2024-07-05")]
+
+
+def test_parse_day_falls_back_to_dayfirst_and_iso():
+    s = pd.Series(["5/7/2024 10:00", "5/7/2024", "2024-07-05", "2024-07-05T10:00:00", "2024-07-05T10:00:00Z"])
+    assert (parse_day(s) == pd.Timestamp("2024-07-05")).all()
+
+
+def test_parse_day_invalid_and_null_become_nat():
+    s = pd.Series(["lixo", None, "05/07/2024"], index=[10, 11, 12], name="Data Inscrição")
+    out = parse_day(s)
+    assert out.isna().tolist() == [True, True, False]
+    assert out.index.tolist() == [10, 11, 12] and out.name == "Data Inscrição"
+    assert out.dtype == "datetime64[ns]"
+
+
+def test_time_keys_local_day_and_hour():
+    # 2024-07-05 02:30 UTC = 2024-07-04 23:30 em Brasília (sexta UTC, quinta local)
+    ms = pd.Timestamp("2024-07-05 02:30", tz="UTC").value // 1_000_000
+    dia, hora, dia_semana = time_keys(np.array([ms]))
+    assert pd.Timestamp(dia[0], unit="D") == pd.Timestamp("2024-07-04")
+    assert hora[0] == 23 and dia_semana[0] == 3
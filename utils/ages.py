@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+# Faixas etárias
+AGE_BINS   = [0, 18, 25, 35, 45, 55, 65, 200]
+AGE_LABELS = ["<18", "18–25", "26–35", "36–45", "46–55", "56–65", "65+"]
+
+
+def compute_idade_anos(births: pd.Series, start: pd.Timestamp) -> pd.Series:
+    """
+    Idade em anos (float, NaN quando a data é inválida) na data de referência `start`,
+    a partir de 'Data de nascimento' no formato dd/mm/aaaa. Tudo em aritmética datetime64:
+    a diferença em dias é a mesma de (start.date() - nascimento.date()). As datas distintas
+    são poucas (dezenas de milhares no máximo), então só elas são parseadas.
+    """
+    codes, uniques = pd.factorize(births)
+    parsed = pd.to_datetime(pd.Index(uniques, dtype=object), format='%d/%m/%Y', errors='coerce')
+    days = (start.normalize() - parsed.normalize()).days.to_numpy(dtype=float, na_value=np.nan)
+    age_days = np.where(codes >= 0, days[codes], np.nan) if len(days) else np.full(len(codes), np.nan)
+    return pd.Series(age_days / 365.25, index=births.index)
+
+
+def age_bands(idade_anos: pd.Series):
+    """Idade inteira (NaN → 0, como antes) e faixa etária categórica (pd.cut em AGE_BINS)."""
+    idade = idade_anos.fillna(0).astype(np.int64)
+    faixa = pd.cut(idade, bins=AGE_BINS, labels=AGE_LABELS, right=True)
+    return idade, faixa
@@ -0,0 +1,113 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class FetchStats:
+    """
+    Registro de uma chamada de `ParticipantsClient.fetch`: uma entrada por página em
+    `pages` (cursor, latência, bytes, itens) e o início da última requisição (espaçamento).
+    Cada chamada tem o seu, então buscas concorrentes no mesmo cliente não se misturam.
+    """
+
+    def __init__(self):
+        self.pages = []
+        self.last_start = 0.0
+
+    def summary(self) -> dict:
+        """Totais agregados das páginas buscadas."""
+        lat = [s["latency_s"] for s in self.pages]
+        return {
+            "pages": len(self.pages),
+            "items": sum(s["items"] for s in self.pages),
+            "bytes": sum(s["bytes"] for s in self.pages),
+            "wire_bytes": sum(s["wire_bytes"] for s in self.pages),
+            "latency_total_s": sum(lat),
+            "latency_max_s": max(lat, default=0.0),
+        }
+
+
+class ParticipantsClient:
+    """
+    Cliente do endpoint de participantes.
+    Mantém uma Session com pool de conexões keep-alive, pede respostas comprimidas
+    e sobrepõe a deduplicação da página N com a requisição da página N+1.
+    Cada chamada de `fetch` devolve o seu `FetchStats` (cursor, latência, bytes, itens
+    por página); o cliente em si não guarda estado de chamada e pode ser compartilhado.
+    Erros 5xx transitórios são repetidos até `retries` vezes.
+    """
+
+    def __init__(self, url: str, key: str, timeout: int = 30, delay: float = 0.1, pool_size: int = 4,
+                 retries: int = 3):
+        self.url = url
+        self.timeout = timeout
+        # intervalo mínimo entre o início de duas requisições (não soma ao processamento)
+        self.delay = delay
+        self.session = requests.Session()
+        # a consulta é idempotente: erros 5xx transitórios são repetidos com backoff
+        retry = Retry(total=retries, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=None)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            "Authorization": key,
+        })
+
+    def _request(self, first: str, stats: FetchStats) -> dict:
+        wait = self.delay - (time.perf_counter() - stats.last_start)
+        if wait > 0:
+            time.sleep(wait)
+        stats.last_start = t0 = time.perf_counter()
+        resp = self.session.post(self.url, json={"firstEmail": first}, timeout=self.timeout)
+        resp.raise_for_status()
+        raw = resp.content
+        env = json.loads(raw)
+        # o corpo vem como string JSON dentro do envelope; decodifica uma única vez aqui
+        payload = json.loads(env["body"]) if isinstance(env.get("body"), str) else env
+        stats.pages.append({
+            "cursor": first,
+            "latency_s": time.perf_counter() - t0,
+            "bytes": len(raw),
+            "wire_bytes": int(resp.headers.get("Content-Length") or len(raw)),
+            "items": len(payload.get("participants", []) or payload.get("items", [])),
+        })
+        return payload
+
+    def fetch(self, first: str = "", seen: set = None):
+        """
+        Percorre a cadeia firstEmail/lastEmail a partir de `first`.
+        Retorna (novos participantes, conjunto de e-mails vistos, último cursor não vazio,
+        `FetchStats` desta chamada).
+        """
+        seen = set() if seen is None else seen
+        participants, cursor = [], first
+        stats = FetchStats()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(self._request, first, stats)
+            while pending is not None:
+                payload = pending.result()
+                batch = payload.get("participants", []) or payload.get("items", [])
+                if not batch: break
+                first = payload.get("lastEmail", "")
+                # dispara a próxima página antes de deduplicar a atual
+                pending = pool.submit(self._request, first, stats) if first else None
+                for g in batch:
+                    e = g.get("email")
+                    if e and e not in seen:
+                        seen.add(e)
+                        participants.append(g)
+                if first:
+                    cursor = first
+        return participants, seen, cursor, stats
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,93 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+from utils.editions import load_edition
+from utils.schema import DESIRED_COLUMNS
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def default_columns(df: pd.DataFrame) -> list:
+    """Colunas exibidas (e exportadas) por padrão: as do formulário (DESIRED_COLUMNS) presentes no frame."""
+    return [c for c in DESIRED_COLUMNS if c in df]
+
+
+def _contains(s: pd.Series, query: str) -> np.ndarray:
+    # busca só nos valores distintos e volta às linhas pelos códigos (nulo não casa)
+    codes, uniques = pd.factorize(s)
+    hit = pd.Index(uniques, dtype=object).astype(str).str.contains(query, case=False, regex=False)
+    return np.append(np.asarray(hit, dtype=bool), False)[codes]
+
+
+def _sorted(s: pd.Series, ascending: bool) -> np.ndarray:
+    # posições em ordem estável, nulos no fim; colunas com tipos misturados ordenam como texto
+    try:
+        return s.reset_index(drop=True).sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+    except TypeError:
+        return s.astype(str).reset_index(drop=True).sort_values(ascending=ascending, kind="stable").index.to_numpy()
+
+
+def row_order(df: pd.DataFrame, search: str = "", search_columns: list = None,
+              sort_by: str = None, ascending: bool = True) -> np.ndarray:
+    """
+    Posições (iloc) das linhas de `df` que contêm `search` (sem caixa) em alguma coluna de
+    `search_columns` (todas, por padrão), ordenadas por `sort_by`. Nada é copiado do frame.
+    """
+    pos = np.arange(len(df))
+    if search:
+        mask = np.zeros(len(df), dtype=bool)
+        for col in search_columns or df.columns:
+            mask |= _contains(df[col], search)
+        pos = pos[mask]
+    if sort_by:
+        pos = pos[_sorted(df[sort_by].iloc[pos], ascending)]
+    return pos
+
+
+@st.cache_resource(max_entries=16)
+def _row_order(ano: str, version: str, search: str, search_columns: tuple,
+               sort_by: str, ascending: bool) -> np.ndarray:
+    return row_order(load_edition(ano), search, list(search_columns), sort_by, ascending)
+
+
+def query_rows(ano: str, version: str, query: dict) -> np.ndarray:
+    """Posições das linhas da edição para uma consulta do navegador (ver `render_browser`)."""
+    return _row_order(ano, version, query["search"], tuple(query["search_columns"]),
+                      query["sort_by"], query["ascending"])
+
+
+def render_browser(ano: str, version: str, df: pd.DataFrame, key: str = "browser") -> dict:
+    """
+    Navegador dos dados brutos com paginação no servidor: busca, ordenação e projeção de
+    colunas rodam sobre o frame em cache (posições memorizadas por versão dos dados e
+    consulta) e só a página visível é enviada ao navegador. Retorna a consulta atual
+    (busca, colunas, ordenação), usada também pela exportação.
+    """
+    columns = list(df.columns)
+    default = default_columns(df)
+    c1, c2, c3 = st.columns([3, 2, 1])
+    selected = c1.multiselect("Colunas", columns, default=default, key=f"{key}_cols")
+    search = c2.text_input("Buscar", key=f"{key}_search").strip()
+    page_size = c3.selectbox("Linhas por página", PAGE_SIZES, key=f"{key}_size")
+    selected = selected or default
+
+    c4, c5 = st.columns([3, 1])
+    sort_by = c4.selectbox("Ordenar por", ["—"] + selected, key=f"{key}_sort")
+    ascending = c5.radio("Ordem", ["Crescente", "Decrescente"], horizontal=True, key=f"{key}_asc") == "Crescente"
+    sort_by = None if sort_by == "—" else sort_by
+
+    # a busca considera só as colunas visíveis
+    query = {"search": search, "search_columns": selected, "sort_by": sort_by, "ascending": ascending}
+    pos = query_rows(ano, version, query)
+    n_pages = max(1, -(-len(pos) // page_size))
+    page = st.number_input("Página", min_value=1, max_value=n_pages, value=1, step=1, key=f"{key}_page")
+    start = (min(page, n_pages) - 1) * page_size
+    visible = df.iloc[pos[start:start + page_size]][selected]
+
+    st.dataframe(visible, use_container_width=True, hide_index=True)
+    st.caption(
+        f"Linhas {start + 1 if len(pos) else 0:,}–{start + len(visible):,} de {len(pos):,}"
+        + (f" (filtradas de {len(df):,})" if search else "")
+        + f" · página {min(page, n_pages)} de {n_pages}"
+    )
+    return query
@@ -0,0 +1,66 @@
+import logging
+import re
+import warnings
+
+import pandas as pd
+
+from utils.schema import CSV_DTYPES, norm_col
+
+logger = logging.getLogger(__name__)
+
+_SKIP_RE = re.compile(r"Skipping line (\d+)")
+
+
+def _dtypes_for(path: str, sep: str) -> dict:
+    # casa os nomes do arquivo com o schema pela forma normalizada (como load_data faz)
+    header = pd.read_csv(path, sep=sep, nrows=0).columns
+    schema = {norm_col(c): t for c, t in CSV_DTYPES.items()}
+    return {c: schema[norm_col(c)] for c in header if norm_col(c) in schema}
+
+
+def iter_csv_typed(path: str, chunksize: int, sep: str = ";", bad_lines: list = None):
+    """
+    Lê o CSV em blocos de `chunksize` linhas com o parser C e o schema de utils/schema.py.
+    Os números das linhas descartadas por formato inválido são acrescentados em `bad_lines`.
+    Limitação do parser C: uma linha com campos a mais que caia exatamente no início de um
+    bloco é aceita truncada em vez de descartada, por isso prefira blocos grandes (≥ 10 mil).
+    """
+    bad_lines = [] if bad_lines is None else bad_lines
+    reader = pd.read_csv(
+        path, sep=sep, engine="c", dtype=_dtypes_for(path, sep),
+        on_bad_lines="warn", chunksize=chunksize,
+    )
+    with reader:
+        while True:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", pd.errors.ParserWarning)
+                try:
+                    chunk = next(reader)
+                except StopIteration:
+                    break
+            for w in caught:
+                bad_lines.extend(int(n) for n in _SKIP_RE.findall(str(w.message)))
+            yield chunk
+
+
+def read_csv_typed(path: str, sep: str = ";", chunksize: int = None) -> pd.DataFrame:
+    """
+    Leitura rápida de CSV: parser C, dtypes explícitos e, opcionalmente, em blocos
+    (`chunksize`) para exports muito grandes. Linhas malformadas continuam sendo
+    descartadas, mas são contadas em `df.attrs["linhas_descartadas"]` e registradas no log.
+    """
+    bad_lines = []
+    if chunksize:
+        chunks = list(iter_csv_typed(path, chunksize, sep=sep, bad_lines=bad_lines))
+        df = pd.concat(chunks, ignore_index=True) if chunks else pd.read_csv(path, sep=sep, nrows=0)
+    else:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", pd.errors.ParserWarning)
+            df = pd.read_csv(path, sep=sep, engine="c", dtype=_dtypes_for(path, sep), on_bad_lines="warn")
+        for w in caught:
+            bad_lines.extend(int(n) for n in _SKIP_RE.findall(str(w.message)))
+    if bad_lines:
+        logger.warning("%s: %d linha(s) malformada(s) descartada(s): %s",
+                       path, len(bad_lines), bad_lines[:20])
+    df.attrs["linhas_descartadas"] = len(bad_lines)
+    return df
@@ -0,0 +1,119 @@
+import os
+import tempfile
+
+import streamlit as st
+import pandas as pd
+from utils.editions import EDITIONS, edition_versions, load_edition
+from utils.normalize import Normalizer
+
+# Série diária persistida por edição (poucas centenas de linhas): dados/.daily/<ano>.csv
+DAILY_DIR = "./dados/.daily"
+DAILY_COLUMNS = ["data", "inscricoes", "confirmados"]
+
+# 'Status do E-mail' contendo "confirm" (ex.: "Confirmado"), avaliado só nos valores distintos
+NORM_CONFIRMADO = Normalizer(("lower", lambda s: "confirm" in s))
+
+
+def _daily_path(ano: str) -> str:
+    return os.path.join(DAILY_DIR, f"{ano}.csv")
+
+
+def _read_daily(ano: str) -> pd.DataFrame:
+    path = _daily_path(ano)
+    if not os.path.exists(path):
+        return pd.DataFrame({c: pd.Series(dtype="int64") for c in DAILY_COLUMNS}).astype({"data": "datetime64[ns]"})
+    daily = pd.read_csv(path, parse_dates=["data"], date_format="%Y-%m-%d")
+    return daily.astype({"data": "datetime64[ns]", "inscricoes": "int64", "confirmados": "int64"})
+
+
+def _write_daily(ano: str, daily: pd.DataFrame) -> None:
+    # grava em arquivo temporário de nome único e troca atomicamente (processos concorrentes
+    # não escrevem no mesmo .tmp)
+    os.makedirs(DAILY_DIR, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=DAILY_DIR, suffix=".tmp", delete=False,
+                                     encoding="utf-8", newline="") as f:
+        tmp = f.name
+    try:
+        daily.to_csv(tmp, index=False, date_format="%Y-%m-%d")
+        os.replace(tmp, _daily_path(ano))
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def _count_days(df: pd.DataFrame) -> pd.DataFrame:
+    # inscrições por dia (coluna nativa 'data', ver data_loader._dates)
+    return (
+        pd.DataFrame({"data": df["data"].to_numpy(), "inscricoes": 1})
+        .dropna(subset=["data"])
+        .groupby("data", as_index=False)
+        .sum()
+        .astype({"data": "datetime64[ns]", "inscricoes": "int64"})
+    )
+
+
+def _confirmed_by_day(df: pd.DataFrame) -> pd.Series:
+    # confirmados por dia da inscrição, sempre do frame atual: o status muda depois do dia
+    confirmado = NORM_CONFIRMADO(df["Status do E-mail"]).eq(True).to_numpy()
+    return pd.Series(confirmado).groupby(df["data"].to_numpy()).sum()
+
+
+def update_daily(ano: str, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Atualiza a série diária persistida da edição com as linhas de `df`. As inscrições são
+    só acrescentadas: contam-se as linhas a partir do último dia salvo (a marca d'água,
+    possivelmente parcial) e os dias anteriores vêm do arquivo; se o número de linhas antes
+    da marca não bater com o salvo (linhas removidas, arquivo de outra fonte), a série é
+    recalculada por inteiro. Os confirmados de todos os dias são recontados do frame atual
+    (status normalizado nos valores distintos + groupby por dia), pois confirmações chegam
+    depois do dia da inscrição.
+    """
+    stored = _read_daily(ano)
+    if len(stored):
+        last = stored["data"].max()
+        older = stored.loc[stored["data"] < last, ["data", "inscricoes"]]
+        recent = (df["data"] >= last).to_numpy()
+        if int((df["data"] < last).sum()) == int(older["inscricoes"].sum()):
+            daily = pd.concat([older, _count_days(df[recent])], ignore_index=True)
+        else:
+            daily = _count_days(df)
+    else:
+        daily = _count_days(df)
+    daily["confirmados"] = daily["data"].map(_confirmed_by_day(df)).fillna(0).astype("int64")
+
+    if not daily.equals(stored):
+        _write_daily(ano, daily)
+    return daily
+
+
+def align(daily: pd.DataFrame, start: pd.Timestamp) -> pd.DataFrame:
+    """
+    Alinha a série pelo início das inscrições: dias desde o início, mês relativo (1 = mês
+    do início) e acumulados de inscrições, confirmados e taxa de confirmação.
+    """
+    out = daily.sort_values("data").reset_index(drop=True)
+    out["dias_desde_inicio"] = (out["data"] - start.normalize()).dt.days
+    out["mes_relativo"] = (
+        (out["data"].dt.year - start.year) * 12 + (out["data"].dt.month - start.month) + 1
+    )
+    out["inscricoes_acumuladas"] = out["inscricoes"].cumsum()
+    out["confirmados_acumulados"] = out["confirmados"].cumsum()
+    out["taxa_confirmacao"] = out["confirmados_acumulados"] / out["inscricoes_acumuladas"] * 100
+    return out
+
+
+@st.cache_resource(max_entries=8)
+def _daily(ano: str, version: str) -> pd.DataFrame:
+    return align(update_daily(ano, load_edition(ano)), EDITIONS[ano]["start"])
+
+
+def load_daily(anos: list = None) -> pd.DataFrame:
+    """
+    Séries diárias alinhadas (ver `align`) das edições pedidas, empilhadas com a coluna `ano`.
+    Atualizadas só quando a versão dos dados da edição muda: inscrições com append dos dias
+    novos, confirmados recontados (ver `update_daily`).
+    """
+    return pd.concat(
+        [_daily(ano, version).assign(ano=ano) for ano, version in edition_versions(anos)],
+        ignore_index=True,
+    )
@@ -1,91 +1,284 @@
 import streamlit as st
 import pandas as pd
-import requests
 import json
+import logging
+import os
+import tempfile
 import time
-import unicodedata
-import re
+from utils.api_client import ParticipantsClient
+from utils import snapshot
+from utils.form_fields import expand_form_fields
+from utils.schema import DESIRED_COLUMNS, compact_frame, norm_col
+from utils.csv_reader import read_csv_typed
+from utils.timebins import parse_day, time_keys
+
+# Estado persistente da sincronização incremental com a API, por edição: cursor e momento
+# da última paginação completa (JSON pequeno) e participantes em JSON Lines, um por linha
+SYNC_DIR = "./dados/.sync"
+# Intervalo (s) entre paginações completas: só elas veem e-mails novos que ordenam antes
+# do cursor e mudanças em participantes já buscados (ex.: "Status do E-mail")
+FULL_SYNC_EVERY = 3600
+# Idade máxima (s) de um snapshot da API para ser reaproveitado; igual ao TTL do cache
+SNAPSHOT_TTL = 600
+
+logger = logging.getLogger(__name__)
+
+
+@st.cache_resource
+def get_client(url: str, key: str) -> ParticipantsClient:
+    """Um cliente (e pool de conexões) por processo, reaproveitado entre cargas."""
+    return ParticipantsClient(url, key)
+
+
+def _sync_files(edition: str = None):
+    # (estado, participantes) da edição em SYNC_DIR
+    name = f"api_{edition}" if edition else "api"
+    return (os.path.join(SYNC_DIR, f"{name}_state.json"),
+            os.path.join(SYNC_DIR, f"{name}_participants.jsonl"))
+
+
+def _write_atomic(path: str, write) -> None:
+    # grava num temporário de nome único no mesmo diretório e troca atomicamente
+    os.makedirs(SYNC_DIR, exist_ok=True)
+    f = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=SYNC_DIR, suffix=".tmp", delete=False)
+    try:
+        with f:
+            write(f)
+        os.replace(f.name, path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+
+
+def _load_sync_state(path: str):
+    # None se não houver estado ou se ele estiver corrompido (força paginação completa)
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        return {"cursor": str(state["cursor"]), "full_at": float(state["full_at"])}
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Estado de sincronização inválido (%r); refazendo a paginação completa", e)
+        return None
+
+
+def _save_sync_state(path: str, cursor: str, full_at: float) -> None:
+    _write_atomic(path, lambda f: json.dump({"cursor": cursor, "full_at": full_at}, f))
+
+
+def _read_participants(path: str):
+    # {email: participante}; linhas repetidas valem pela última. None se faltar ou estiver corrompido
+    try:
+        with open(path, encoding="utf-8") as f:
+            out = {}
+            for line in f:
+                g = json.loads(line)
+                out[g["email"]] = g
+        return out
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Participantes sincronizados inválidos (%r); refazendo a paginação completa", e)
+        return None
+
+
+def _dump_participants(f, participants: list) -> None:
+    f.writelines(json.dumps(g, ensure_ascii=False) + "\n" for g in participants)
+
+
+def sync_participants(client: ParticipantsClient, edition: str = None, full_every: float = FULL_SYNC_EVERY):
+    """
+    Sincronização incremental. A API pagina por e-mail, então retomar do último cursor só
+    enxerga e-mails que ordenam depois dele: cada chamada retoma dali e acrescenta
+    (append no JSON Lines) os participantes ainda não vistos, e a cada `full_every`
+    segundos — ou se o estado salvo faltar ou estiver corrompido — a paginação é refeita
+    do início e substitui a lista inteira, trazendo e-mails novos em qualquer posição e
+    o estado atual dos já conhecidos (ex.: "Status do E-mail").
+    Cada `edition` tem o seu estado (ver `_sync_files`).
+    Retorna (participantes, `FetchStats` da chamada).
+    """
+    state_file, participants_file = _sync_files(edition)
+    state = _load_sync_state(state_file)
+    stored = _read_participants(participants_file) if state is not None else None
+    if stored is None or time.time() - state["full_at"] >= full_every:
+        full_at = time.time()
+        participants, _, cursor, stats = client.fetch()
+        _write_atomic(participants_file, lambda f: _dump_participants(f, participants))
+        _save_sync_state(state_file, cursor, full_at)
+        return participants, stats
+
+    novos, _, cursor, stats = client.fetch(first=state["cursor"], seen=set(stored))
+    if novos:
+        with open(participants_file, "a", encoding="utf-8") as f:
+            _dump_participants(f, novos)
+        stored.update((g["email"], g) for g in novos)
+    if cursor != state["cursor"]:
+        _save_sync_state(state_file, cursor, state["full_at"])
+    return list(stored.values()), stats
+
+
+def reset_sync_state(edition: str = None) -> None:
+    """Apaga o estado incremental da edição, forçando uma paginação completa na próxima carga."""
+    for path in _sync_files(edition):
+        if os.path.exists(path):
+            os.remove(path)
+
 
 @st.cache_data(ttl=600)
-def load_data(path: str = None) -> pd.DataFrame:
+def load_data(path: str = None, incremental: bool = False, use_snapshot: bool = True,
+              fast_csv: bool = True, chunksize: int = None, compact: bool = False,
+              edition: str = None, endpoint: str = "URL", version: str = None) -> pd.DataFrame:
+    """
+    Versão em cache (st.cache_data, TTL de 10 min) de `build_data`. `version` (no CSV,
+    `snapshot.source_key`, com tamanho e mtime) só entra na chave do cache: quando o
+    arquivo muda, a versão nova nunca recebe os dados antigos.
+    """
+    return build_data(path, incremental, use_snapshot, fast_csv, chunksize, compact, edition, endpoint)
+
+
+def build_data(path: str = None, incremental: bool = False, use_snapshot: bool = True,
+               fast_csv: bool = True, chunksize: int = None, compact: bool = False,
+               edition: str = None, endpoint: str = "URL") -> pd.DataFrame:
     """
     Carrega dados de CSV (quando `path` informado) ou via API (quando `path` é None ou vazio).
+    Na API, `endpoint` é o nome do segredo (st.secrets) com a URL da edição e `edition`
+    separa o snapshot e o estado de sincronização de cada edição.
     Expande formFields, padroniza somente as colunas que batem com o header desejado,
     e garante que todas as colunas desejadas existam (criando-as vazias se não vierem).
+    Com `incremental=True`, a carga via API busca só participantes novos desde a última
+    sincronização, com uma paginação completa a cada FULL_SYNC_EVERY segundos (ver
+    `sync_participants`), em vez de repaginar tudo a cada TTL.
+    Com `use_snapshot=True` (e pyarrow instalado), o resultado normalizado é gravado em
+    um snapshot Feather compartilhado entre processos e lido de lá enquanto válido.
+    Com `fast_csv=True`, o CSV é lido pelo parser C com dtypes explícitos (opcionalmente
+    em blocos de `chunksize` linhas) e as linhas malformadas descartadas são contadas em
+    `df.attrs["linhas_descartadas"]`; `fast_csv=False` mantém o parser Python antigo.
+    Com `compact=True`, devolve a representação compacta de `compact_frame` (category e
+    boolean nas colunas de baixa cardinalidade), com a memória antes/depois em `df.attrs`.
+    O tempo, as linhas e os bytes de cada etapa vão para `df.attrs["diagnostico"]` e
+    para o log (ver `_diagnose`).
     """
+    t_start = time.perf_counter()
+    etapas = []
+
+    # 0. Snapshot colunar (CSV: enquanto o arquivo não mudar; API: até SNAPSHOT_TTL)
+    source = snapshot.source_key(path, edition)
+    if use_snapshot:
+        t0 = time.perf_counter()
+        cached = snapshot.read_snapshot(source, max_age=SNAPSHOT_TTL if not path else None)
+        if cached is not None:
+            _stage(etapas, "snapshot", t0, cached)
+            if compact:
+                t0 = time.perf_counter()
+                cached = compact_frame(cached)
+                _stage(etapas, "compact", t0, cached)
+            return _diagnose(cached, "snapshot", source, etapas, t_start)
+
     # 1. Carregamento bruto
+    t0 = time.perf_counter()
+    rede = {}
     if not path:
-        url = st.secrets.get("URL")
+        url = st.secrets.get(endpoint)
         key = st.secrets.get("API_KEY")
         if not url or not key:
-            raise ValueError("Defina 'URL' e 'API_KEY' em st.secrets.")
-        hdr = {"Content-Type":"application/json","Accept":"application/json","Authorization":key}
-        participants, seen, first = [], set(), ""
-        while True:
-            resp = requests.post(url, json={"firstEmail": first}, headers=hdr, timeout=30)
-            resp.raise_for_status()
-            env = resp.json()
-            payload = json.loads(env["body"]) if isinstance(env.get("body"), str) else env
-            batch = payload.get("participants", []) or payload.get("items", [])
-            if not batch: break
-            for g in batch:
-                e = g.get("email")
-                if e and e not in seen:
-                    seen.add(e)
-                    participants.append(g)
-            first = payload.get("lastEmail","")
-            if not first: break
-            time.sleep(0.1)
+            raise ValueError(f"Defina '{endpoint}' e 'API_KEY' em st.secrets.")
+        client = get_client(url, key)
+        if incremental:
+            participants, stats = sync_participants(client, edition)
+        else:
+            participants, _, _, stats = client.fetch()
+        resumo = stats.summary()
+        rede = {"paginas": resumo["pages"], "bytes_rede": resumo["wire_bytes"]}
         df = pd.DataFrame(participants)
     else:
-        df = pd.read_csv(path, sep=";", engine="python", on_bad_lines="skip")
+        if fast_csv:
+            df = read_csv_typed(path, sep=";", chunksize=chunksize)
+        else:
+            df = pd.read_csv(path, sep=";", engine="python", on_bad_lines="skip")
+        rede = {"bytes_arquivo": os.path.getsize(path)}
+    _stage(etapas, "api" if not path else "csv", t0, df, **rede)
+
+    attrs = dict(df.attrs)
+    for name, stage in NORMALIZE_STAGES:
+        t0 = time.perf_counter()
+        df = stage(df)
+        _stage(etapas, name, t0, df)
+    df.attrs.update(attrs)
+    if use_snapshot:
+        t0 = time.perf_counter()
+        snapshot.write_snapshot(df, source)
+        _stage(etapas, "snapshot_write", t0, df)
+    if compact:
+        t0 = time.perf_counter()
+        df = compact_frame(df)
+        _stage(etapas, "compact", t0, df)
+    return _diagnose(df, "api" if not path else "csv", source, etapas, t_start)
+
+
+def _stage(etapas: list, name: str, t0: float, df: pd.DataFrame, **extra) -> None:
+    # bytes rasos (sem medir o conteúdo das strings): barato o bastante para cada etapa
+    etapas.append({
+        "etapa": name,
+        "tempo_s": round(time.perf_counter() - t0, 4),
+        "linhas": len(df),
+        "colunas": df.shape[1],
+        "bytes": int(df.memory_usage(index=True, deep=False).sum()),
+        **extra,
+    })
+
+
+def _diagnose(df: pd.DataFrame, origem: str, source: str, etapas: list, t_start: float) -> pd.DataFrame:
+    """
+    Anexa a `df.attrs["diagnostico"]` as etapas medidas por build_data (tempo, linhas,
+    colunas, bytes), o total, a memória real do resultado e o instante da construção
+    (usado pelo painel de diagnóstico para distinguir acerto de falta de cache), e
+    emite o mesmo registro no log.
+    """
+    diag = {
+        "origem": origem,
+        "fonte": source,
+        "etapas": etapas,
+        "total_s": round(time.perf_counter() - t_start, 4),
+        "memoria_bytes": int(df.memory_usage(index=True, deep=True).sum()),
+        "construido_em": time.time(),
+    }
+    df.attrs["diagnostico"] = diag
+    logger.info("build_data %s", json.dumps(diag, ensure_ascii=False))
+    return df
+
 
+def _timestamps(df: pd.DataFrame) -> pd.DataFrame:
     # 2. Tratamento de timestamps
     if "createdAt" in df.columns:
-        df["createdAt_ms"] = df["createdAt"].astype(int)
+        df["createdAt_ms"] = df["createdAt"].astype("int64")
         df["createdAt_utc"] = pd.to_datetime(df["createdAt_ms"], unit="ms", utc=True)
         df["createdAt_local"] = (
             df["createdAt_utc"].dt.tz_convert("America/Sao_Paulo")
                               .dt.tz_localize(None)
         )
-        df["data"] = df["createdAt_local"].dt.date
-        df["hora"] = df["createdAt_local"].dt.time
-        df["createdAt_str"] = df["createdAt_local"].dt.strftime("%Y-%m-%d %H:%M:%S")
+        # chaves nativas por aritmética inteira: dia (datetime64), hora e dia da semana (int8)
+        dia, df["hora"], df["dia_semana"] = time_keys(df["createdAt_ms"].to_numpy())
+        df["data"] = pd.to_datetime(dia, unit="D")
+    return df
+
 
+def _form_fields(df: pd.DataFrame) -> pd.DataFrame:
     # 3. Expansão de formFields
     if "formFields" in df.columns:
-        recs = []
-        for lst in df["formFields"]:
-            row = {}
-            for it in lst:
-                v = it.get("value")
-                if isinstance(v, list):
-                    v = ", ".join(v)
-                row[it.get("id")] = v
-            recs.append(row)
-        wide = pd.DataFrame(recs, index=df.index)
+        wide = expand_form_fields(df["formFields"])
         df = pd.concat([df, wide], axis=1).drop(columns=["formFields"])
+    return df
 
-    # 4. Header desejado
-    header_str = """
-    "Email";"Tipo de ingresso";"Nome na credencial";"Nome";"QR Code";"Status do E-mail";
-    "Data Inscrição";"Telefone";"País";"Estado";"Cidade";"CPF";"Passaporte";"Data de nascimento";
-    "Com qual gênero você se identifica?";"Participou de algum RNP anterior? Se sim, quais as edições?";"Escolaridade";
-    "Temas de interesse";"Qual a sua principal área de atuação?";"Você é professor?";"Em qual empresa você trabalha?";
-    "Trabalha com tecnologia?";"A empresa em que você trabalha faz parte do Porto Digital?";
-    "Você desenvolve alguma atividade empresarial?";"Já foi atendido pelo Sebrae?"
-    """
-    desired = [c.strip('"') for c in header_str.strip().replace("\n","").split(";")]
 
-    # 5. Normalização helper
-    def _norm(s: str) -> str:
-        s = unicodedata.normalize("NFKD", s).encode("ascii","ignore").decode()
-        return re.sub(r"\W+","", s).lower()
+def _header(df: pd.DataFrame) -> pd.DataFrame:
+    # 4–5. Header desejado e normalização de nomes (ver utils/schema.py)
+    desired = DESIRED_COLUMNS
 
     # 6. Mapeia colunas existentes para as desejadas, via forma normalizada
     raw = df.columns.tolist()
-    norm_raw = {c: _norm(c) for c in raw}
-    norm_des = { _norm(c): c for c in desired }
+    norm_raw = {c: norm_col(c) for c in raw}
+    norm_des = { norm_col(c): c for c in desired }
     rename_map = {
         orig: norm_des[norm_raw[orig]]
         for orig in raw
@@ -103,3 +296,23 @@ def load_data(path: str = None) -> pd.DataFrame:
 
     # 9. Retorna só as desejadas + quaisquer extras
     return df
+
+
+def _dates(df: pd.DataFrame) -> pd.DataFrame:
+    # 10. 'Data Inscrição' (texto dd/mm/aaaa) parseada uma vez, com formato explícito;
+    #     sem createdAt (CSV), é ela que dá o dia e o dia da semana da inscrição
+    if "Data Inscrição" in df.columns:
+        df["data_inscricao"] = parse_day(df["Data Inscrição"])
+        if "data" not in df.columns:
+            df["data"] = df["data_inscricao"]
+            df["dia_semana"] = df["data"].dt.weekday.astype("Int8")
+    return df
+
+
+# Etapas de normalização de build_data, na ordem (nome, função)
+NORMALIZE_STAGES = [
+    ("timestamps", _timestamps),
+    ("formFields", _form_fields),
+    ("header", _header),
+    ("datas", _dates),
+]
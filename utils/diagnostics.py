@@ -0,0 +1,45 @@
+import streamlit as st
+import pandas as pd
+from utils.figure_cache import figure_cache
+
+
+def _fmt_bytes(n) -> str:
+    if n is None or pd.isna(n):
+        return ""
+    for unit in ("B", "KB", "MB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def render_load_panel(frames: dict, run_started: float) -> None:
+    """
+    Painel de diagnóstico na sidebar: para cada edição ({ano: DataFrame}), a origem da
+    carga, se a execução atual acertou o cache (dados construídos antes de `run_started`,
+    o `time.time()` do início do script) ou precisou reconstruí-los, a memória ocupada e
+    o tempo, linhas e bytes de cada etapa registrados por build_data em `df.attrs`,
+    além dos contadores do cache de figuras.
+    """
+    with st.sidebar.expander("Diagnóstico de carga", expanded=True):
+        for ano, df in frames.items():
+            diag = df.attrs.get("diagnostico")
+            st.markdown(f"**{ano}**")
+            if not diag:
+                st.caption("sem diagnóstico registrado")
+                continue
+            cache = "falta (recarregado)" if diag["construido_em"] >= run_started else "acerto"
+            st.caption(
+                f"origem: {diag['origem']} · cache: {cache} · "
+                f"carga: {diag['total_s']:.2f}s · memória: {_fmt_bytes(diag['memoria_bytes'])}"
+            )
+            etapas = pd.DataFrame(diag["etapas"])
+            for col in ("bytes", "bytes_rede", "bytes_arquivo"):
+                if col in etapas.columns:
+                    etapas[col] = etapas[col].map(_fmt_bytes)
+            st.dataframe(etapas, hide_index=True, use_container_width=True)
+        fc = figure_cache().stats()
+        st.caption(
+            f"figuras em cache: {fc['entradas']} · acertos: {fc['acertos']} · "
+            f"faltas: {fc['faltas']} · descartes: {fc['descartes']}"
+        )
@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+import pandas as pd
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from utils.prepare import api_refresher, data_version, load_shared, START_2024, START_2025
+
+# Registro das edições: fonte ("api" ou "csv"), caminho do CSV, segredo com a URL da API
+# (`endpoint`, nome da chave em st.secrets; a API_KEY é comum) e data de início das inscrições.
+# Para incluir um ano basta acrescentar a entrada, ex.:
+# "2023": {"fonte": "csv", "path": "./dados/2023.csv", "start": pd.Timestamp('2023-07-01 08:00:00')},
+# "2026": {"fonte": "api", "path": None, "endpoint": "URL_2026", "start": pd.Timestamp('2026-06-01 08:00:00')},
+EDITIONS = {
+    "2024": {"fonte": "csv", "path": "./dados/2024.csv", "start": START_2024},
+    "2025": {"fonte": "api", "path": None, "endpoint": "URL", "start": START_2025},
+}
+
+
+def _path(ano: str):
+    ed = EDITIONS[ano]
+    return ed["path"] if ed["fonte"] == "csv" else None
+
+
+def _args(ano: str) -> tuple:
+    # (path, start, edição, endpoint): os mesmos argumentos em toda chamada, pois são a
+    # chave de cache do atualizador da API (ver prepare.api_refresher)
+    ed = EDITIONS[ano]
+    return _path(ano), ed["start"], ano, ed.get("endpoint", "URL")
+
+
+def load_edition(ano: str) -> pd.DataFrame:
+    """DataFrame preparado (compartilhado, ver `load_shared`) de uma edição registrada."""
+    return load_shared(*_args(ano))
+
+
+def edition_status(ano: str):
+    """Estado do atualizador em segundo plano de uma edição da API (None para CSV)."""
+    if EDITIONS[ano]["fonte"] != "api":
+        return None
+    _, start, edition, endpoint = _args(ano)
+    return api_refresher(edition, endpoint, start).status()
+
+
+def edition_versions(anos: list = None) -> tuple:
+    """((ano, versão dos dados), ...) — chave de cache para tudo que é derivado das edições."""
+    return tuple((ano, data_version(*_args(ano))) for ano in (anos or EDITIONS))
+
+
+def load_editions(anos: list = None, max_workers: int = 4) -> dict:
+    """
+    Carrega as edições pedidas (todas, por padrão) em paralelo num pool de threads:
+    a API é I/O e o parser de CSV libera o GIL, então o tempo total fica próximo ao
+    da edição mais lenta em vez da soma. Retorna {ano: DataFrame}.
+    """
+    anos = list(anos or EDITIONS)
+    ctx = get_script_run_ctx()
+
+    def _load(ano):
+        # as threads do pool precisam do contexto da sessão para usar st.cache_* e st.secrets
+        add_script_run_ctx(ctx=ctx)
+        return load_edition(ano)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(anos)) or 1) as pool:
+        return dict(zip(anos, pool.map(_load, anos)))
+
+
+@st.cache_resource(max_entries=2)
+def _combined(versions: tuple) -> pd.DataFrame:
+    frames = load_editions([ano for ano, _ in versions])
+    return pd.concat([df.assign(ano=ano) for ano, df in frames.items()], ignore_index=True)
+
+
+def load_combined(anos: list = None) -> pd.DataFrame:
+    """
+    Todas as edições pedidas num único DataFrame com a coluna `ano` (visão rasa, sem cópia).
+    Recalculado só quando a versão dos dados de alguma edição muda.
+    """
+    return _combined(edition_versions(anos)).copy(deep=False)
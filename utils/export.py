@@ -0,0 +1,152 @@
+import hashlib
+import os
+import threading
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+from utils.browser import query_rows
+from utils.editions import load_edition
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow é opcional: sem ele só há exportação em CSV
+    pa = pq = None
+
+# Exportações geradas em disco, uma por (versão dos dados, consulta, colunas, formato):
+# dados/.exports/<ano>_<hash>.<ext>; as mais antigas além de MAX_FILES são removidas
+EXPORT_DIR = "./dados/.exports"
+MAX_FILES = 16
+# linhas copiadas do frame em cache por vez
+CHUNK_ROWS = 20_000
+
+
+def formats() -> dict:
+    """Formatos disponíveis: {nome: (extensão, mime)}; Parquet só com pyarrow instalado."""
+    out = {"CSV": ("csv", "text/csv")}
+    if pq is not None:
+        out["Parquet"] = ("parquet", "application/vnd.apache.parquet")
+    return out
+
+
+def iter_chunks(df: pd.DataFrame, pos: np.ndarray, columns: list, chunk_rows: int = CHUNK_ROWS):
+    """Fatias de até `chunk_rows` linhas (posições `pos`, colunas `columns`) do frame."""
+    for i in range(0, len(pos), chunk_rows):
+        yield df.iloc[pos[i:i + chunk_rows]][columns]
+
+
+def write_csv(f, chunks) -> None:
+    # cabeçalho só no primeiro bloco
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(f, header=i == 0, index=False)
+
+
+def write_parquet(f, chunks, columns: list) -> None:
+    # texto (object) vira string para o schema do primeiro bloco valer nos seguintes
+    writer = None
+    for chunk in chunks:
+        chunk = chunk.astype({c: "string" for c in chunk.columns if chunk[c].dtype == object})
+        table = pa.Table.from_pandas(chunk, schema=writer.schema if writer else None, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(f, table.schema)
+        writer.write_table(table)
+    if writer is None:
+        # nenhuma linha: arquivo só com as colunas
+        writer = pq.ParquetWriter(f, pa.Table.from_pandas(pd.DataFrame(columns=columns)).schema)
+    writer.close()
+
+
+def _prune() -> None:
+    files = sorted(
+        (os.path.join(EXPORT_DIR, n) for n in os.listdir(EXPORT_DIR) if not n.endswith(".tmp")),
+        key=os.path.getmtime,
+    )
+    for path in files[:-MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def export_key(version: str, query: dict, columns: list, fmt: str) -> str:
+    """Hash da exportação: versão dos dados, consulta do navegador, colunas e formato."""
+    key = repr((version, query["search"], query["search_columns"], query["sort_by"],
+                query["ascending"], columns, fmt))
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def export_file(ano: str, version: str, query: dict, columns: list, fmt: str) -> str:
+    """
+    Caminho do arquivo com as linhas da consulta do navegador (`query`) e as `columns`
+    pedidas, no formato `fmt` (ver `formats`). O arquivo é escrito em blocos de CHUNK_ROWS
+    linhas a partir do frame em cache, sem montar uma segunda cópia inteira em memória,
+    e reaproveitado por todas as sessões enquanto a versão dos dados não muda.
+    """
+    ext, _ = formats()[fmt]
+    dest = os.path.join(EXPORT_DIR, f"{ano}_{export_key(version, query, columns, fmt)}.{ext}")
+    if os.path.exists(dest):
+        return dest
+
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    chunks = iter_chunks(load_edition(ano), query_rows(ano, version, query), columns)
+    # grava em arquivo temporário e troca atomicamente (sessões concorrentes não se atropelam)
+    tmp = f"{dest}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if fmt == "CSV":
+        # UTF-8 com BOM para abrir direto no Excel
+        with open(tmp, "w", encoding="utf-8-sig", newline="") as f:
+            write_csv(f, chunks)
+    else:
+        with open(tmp, "wb") as f:
+            write_parquet(f, chunks, columns)
+    os.replace(tmp, dest)
+    _prune()
+    return dest
+
+
+def read_export(ano: str, version: str, query: dict, columns: list, fmt: str) -> bytes:
+    """
+    Conteúdo do arquivo de `export_file`. Se outra sessão o remover (`_prune`) entre a
+    geração e a leitura, o arquivo é gerado de novo.
+    """
+    for attempt in range(3):
+        try:
+            with open(export_file(ano, version, query, columns, fmt), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            if attempt == 2:
+                raise
+
+
+def render_export(ano: str, version: str, query: dict, columns: list, default: list,
+                  key: str = "export") -> None:
+    """
+    Exportação das linhas filtradas pelo navegador (busca e ordenação de `query`) com
+    seleção de colunas e formato. O arquivo só é gerado e lido no clique em "Gerar arquivo";
+    o conteúdo fica na sessão, ligado ao hash da exportação (`export_key`), e o botão de
+    download só aparece enquanto a consulta, as colunas e o formato forem os mesmos:
+    os demais reruns não leem nem reenviam o arquivo.
+    """
+    with st.expander("Exportar participantes filtrados"):
+        selected = st.multiselect("Colunas exportadas", columns, default=default, key=f"{key}_cols") or default
+        fmt = st.radio("Formato", list(formats()), horizontal=True, key=f"{key}_fmt")
+        if pq is None:
+            st.caption("Parquet indisponível: instale o pyarrow.")
+        ext, mime = formats()[fmt]
+        digest = export_key(version, query, selected, fmt)
+        if st.button("Gerar arquivo", key=f"{key}_go"):
+            st.session_state[f"{key}_file"] = (digest, read_export(ano, version, query, selected, fmt))
+
+        stored = st.session_state.get(f"{key}_file")
+        if stored is None or stored[0] != digest:
+            # consulta mudou: o arquivo gerado antes não vale mais
+            st.session_state.pop(f"{key}_file", None)
+            return
+        st.download_button(
+            f"Baixar {fmt} ({len(stored[1]) / 1024:,.0f} KB)",
+            data=stored[1],
+            file_name=f"participantes_{ano}.{ext}",
+            mime=mime,
+            key=f"{key}_download",
+            on_click="ignore",
+        )
@@ -0,0 +1,63 @@
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+# Número máximo de figuras mantidas (todas as páginas); as menos usadas saem primeiro
+MAX_FIGURES = 64
+
+
+class FigureCache:
+    """
+    Figuras Plotly prontas, compartilhadas entre sessões, uma por (página, gráfico).
+    Cada entrada guarda a versão dos dados (`edition_versions`) com que foi construída:
+    enquanto a versão não muda, a figura é reaproveitada sem reconstrução; quando muda,
+    a primeira execução reconstrói e substitui a entrada. LRU limitado a `max_entries`.
+    As figuras devolvidas são compartilhadas e não devem ser modificadas.
+    """
+
+    def __init__(self, max_entries: int = MAX_FIGURES):
+        self.max_entries = max_entries
+        self._store = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, page: str, chart_id: str, version, build):
+        key = (page, chart_id)
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and entry[0] == version:
+                self._store.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        # constrói fora do lock: figuras de páginas diferentes não esperam umas pelas outras
+        fig = build()
+        with self._lock:
+            self._store[key] = (version, fig)
+            self._store.move_to_end(key)
+            self.misses += 1
+            while len(self._store) > self.max_entries:
+                self._store.popitem(last=False)
+                self.evictions += 1
+        return fig
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entradas": len(self._store), "acertos": self.hits,
+                    "faltas": self.misses, "descartes": self.evictions}
+
+
+@st.cache_resource
+def figure_cache() -> FigureCache:
+    """Cache de figuras do processo (um só para todas as sessões)."""
+    return FigureCache()
+
+
+def cached_figure(page: str, chart_id: str, version, build):
+    """
+    Figura `chart_id` da página `page` para a versão de dados `version`, construída por
+    `build()` (sem argumentos) só quando ainda não existe para essa versão.
+    """
+    return figure_cache().get_or_build(page, chart_id, version, build)
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+
+def expand_form_fields(form_fields: pd.Series) -> pd.DataFrame:
+    """
+    Expande a coluna `formFields` (lista de {"id", "value"} por participante) para formato largo.
+    Valores em lista viram texto separado por ", "; ids repetidos na mesma linha: vale o último.
+    É o caminho usado por load_data: em CPython o acesso item a item domina e este loop
+    mede igual ou melhor que o pivot em lote (ver benchmarks/bench_form_fields.py).
+    """
+    recs = []
+    for lst in form_fields:
+        row = {}
+        for it in lst if isinstance(lst, list) else []:
+            v = it.get("value")
+            if isinstance(v, list):
+                v = ", ".join(v)
+            row[it.get("id")] = v
+        recs.append(row)
+    return pd.DataFrame(recs, index=form_fields.index)
+
+
+def form_fields_long(form_fields: pd.Series) -> pd.DataFrame:
+    """
+    Achata o lote inteiro numa tabela longa (row, id, value), onde `row` é a posição
+    da linha em `form_fields`. Valores em lista são mantidos como lista.
+    """
+    lists = [l if isinstance(l, list) else [] for l in form_fields.tolist()]
+    lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    items = [it for l in lists for it in l]
+    return pd.DataFrame({
+        "row": np.repeat(np.arange(len(lists)), lengths),
+        "id": np.fromiter((it.get("id") for it in items), dtype=object, count=len(items)),
+        "value": np.fromiter((it.get("value") for it in items), dtype=object, count=len(items)),
+    })
+
+
+def pivot_form_fields(long: pd.DataFrame, index: pd.Index) -> pd.DataFrame:
+    """
+    Pivota a tabela longa de `form_fields_long` para formato largo numa única atribuição
+    vetorizada (matriz linhas × campos indexada pelos códigos de linha e de campo).
+    Produz o mesmo resultado que `expand_form_fields`.
+    """
+    vals = long["value"].to_numpy(dtype=object, copy=True)
+    for i in np.flatnonzero([isinstance(v, list) for v in vals]):
+        vals[i] = ", ".join(vals[i])
+    # códigos na ordem de primeira aparição (mesma ordem de colunas do loop)
+    codes, fields = pd.factorize(long["id"].to_numpy(dtype=object))
+    keep = codes >= 0
+    out = np.full((len(index), len(fields)), np.nan, dtype=object)
+    out[long["row"].to_numpy()[keep], codes[keep]] = vals[keep]
+    return pd.DataFrame(out, index=index, columns=list(fields)).infer_objects()
@@ -0,0 +1,128 @@
+import hashlib
+import secrets
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+from utils.editions import edition_versions, load_editions
+
+# Normalização das chaves de identidade antes do hash: vetorizada e sem memo, para que
+# nenhum e-mail ou CPF em claro fique guardado no processo
+
+
+def norm_email(s: pd.Series) -> pd.Series:
+    email = s.astype("string").str.strip().str.lower()
+    return email.mask(email == "")
+
+
+def norm_cpf(s: pd.Series) -> pd.Series:
+    # só os dígitos; vazio vira nulo
+    digits = s.astype("string").str.replace(r"\D", "", regex=True)
+    return digits.mask(digits == "")
+
+
+# Chave do hash (16 caracteres, SipHash do pandas): derivada de `ID_SALT` em st.secrets,
+# estável entre processos, ou aleatória por processo
+_SALT = None
+
+
+def _salt() -> str:
+    global _SALT
+    if _SALT is None:
+        configured = st.secrets.get("ID_SALT")
+        _SALT = hashlib.sha256(configured.encode("utf-8")).hexdigest()[:16] if configured \
+            else secrets.token_hex(8)
+    return _SALT
+
+
+def hash_keys(s: pd.Series, kind: str) -> np.ndarray:
+    """
+    Chaves uint64 (SipHash com chave secreta, `pd.util.hash_array`) dos identificadores já
+    normalizados de `s`, com o tipo (`kind`) como prefixo; 0 onde o valor é nulo.
+    Nenhum texto em claro sai desta função.
+    """
+    valid = s.notna().to_numpy()
+    keys = np.zeros(len(s), dtype=np.uint64)
+    values = (kind + ":" + s[valid].astype(str)).to_numpy(dtype=object)
+    keys[valid] = pd.util.hash_array(values, encoding="utf8", hash_key=_salt(), categorize=False)
+    return keys
+
+
+class IdentityIndex:
+    """
+    Índice de identidade entre edições: por edição, só as chaves hasheadas de e-mail e,
+    com `use_cpf`, de CPF (só dígitos), ver `hash_keys`. Uma pessoa reaparece quando o
+    e-mail ou o CPF coincide. Cada comparação entre edições é um hash join (tabela de hash do
+    pandas sobre as chaves da outra edição), linear no número de linhas.
+    """
+
+    def __init__(self, frames: dict, use_cpf: bool = True):
+        self.anos = sorted(frames)
+        self.keys = {}
+        for ano, df in frames.items():
+            email = hash_keys(norm_email(df["Email"]), "email") if "Email" in df.columns \
+                else np.zeros(len(df), dtype=np.uint64)
+            cpf = hash_keys(norm_cpf(df["CPF"]), "cpf") if use_cpf and "CPF" in df.columns \
+                else np.zeros(len(df), dtype=np.uint64)
+            self.keys[ano] = (email, cpf)
+        self._tables = {}
+
+    def _table(self, ano: str):
+        # tabelas de hash (pd.Index) das chaves não nulas de uma edição, criadas sob demanda
+        if ano not in self._tables:
+            self._tables[ano] = tuple(pd.Index(np.unique(k[k != 0])) for k in self.keys[ano])
+        return self._tables[ano]
+
+    def found_in(self, ano: str, outros) -> np.ndarray:
+        """Máscara das linhas de `ano` cujo e-mail ou CPF aparece em alguma edição de `outros`."""
+        outros = outros if isinstance(outros, list) else [outros]
+        email, cpf = self.keys[ano]
+        mask = np.zeros(len(email), dtype=bool)
+        for outro in outros:
+            t_email, t_cpf = self._table(outro)
+            mask |= (email != 0) & (t_email.get_indexer(email) >= 0)
+            mask |= (cpf != 0) & (t_cpf.get_indexer(cpf) >= 0)
+        return mask
+
+    def returning(self, ano: str) -> np.ndarray:
+        """Participantes de `ano` que estiveram em alguma edição anterior registrada."""
+        return self.found_in(ano, [a for a in self.anos if a < ano])
+
+    def returning_rate(self, ano: str) -> float:
+        """% de participantes de `ano` medidos como retornantes (NaN sem edição anterior)."""
+        anteriores = [a for a in self.anos if a < ano]
+        if not anteriores or not len(self.keys[ano][0]):
+            return float("nan")
+        return self.returning(ano).mean() * 100
+
+    def retention(self, coorte: str, ano: str) -> float:
+        """% da coorte (estreantes em `coorte`) que voltou em `ano`."""
+        estreantes = ~self.returning(coorte)
+        if not estreantes.any():
+            return float("nan")
+        return self.found_in(coorte, ano)[estreantes].mean() * 100
+
+    def retention_table(self) -> pd.DataFrame:
+        """Retenção (%) de cada coorte (linhas) em cada edição posterior (colunas)."""
+        return pd.DataFrame(
+            {ano: [self.retention(c, ano) if ano > c else np.nan for c in self.anos] for ano in self.anos},
+            index=pd.Index(self.anos, name="coorte"),
+        )
+
+    def overlap(self) -> pd.DataFrame:
+        """Participantes de cada edição (linhas) encontrados em cada outra edição (colunas)."""
+        return pd.DataFrame(
+            {b: [int(self.found_in(a, b).sum()) if a != b else len(self.keys[a][0]) for a in self.anos]
+             for b in self.anos},
+            index=pd.Index(self.anos, name="ano"),
+        )
+
+
+@st.cache_resource(max_entries=2)
+def _identity(versions: tuple) -> IdentityIndex:
+    return IdentityIndex(load_editions([ano for ano, _ in versions]))
+
+
+def load_identity() -> IdentityIndex:
+    """Índice de identidade de todas as edições registradas, refeito quando os dados mudam."""
+    return _identity(edition_versions())
@@ -0,0 +1,122 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+from utils.prepare import COL_GEN, COL_HIST, NORM_FLAG
+from utils.tags import TagIndex
+from utils.editions import edition_versions, load_editions
+
+# Dimensões do cubo: contagens por valor (value_counts, sem NaN) em cada ano
+DIMENSIONS = [
+    "Estado", "estado_proc", "Região", "País", "Cidade_proc", COL_GEN, "genero_cat", "faixa",
+    "hist_cat", "Escolaridade_proc", "Escolaridade_raw", "Qual a principal área de de atuação",
+]
+# Perguntas Sim/Não: contadas sobre o texto normalizado (strip + lower)
+FLAG_DIMENSIONS = [
+    "Trabalha com tecnologia", "Você é professor?",
+    "A empresa que você trabalha faz parte do Porto DIgital",
+    "Você desenvolve alguma atividade empresarial?",
+]
+# Respostas com vários valores separados por vírgula: indexadas como tags (utils/tags.py),
+# contadas por tag (não por texto completo da resposta)
+TAG_DIMENSIONS = ["Temas de interesse", COL_HIST]
+# Colunas numéricas com média pré-calculada por ano
+MEAN_COLUMNS = ["idade_anos"]
+# Colunas com total de respostas em branco (nulo ou texto vazio) por ano
+BLANK_COLUMNS = [COL_HIST]
+
+
+class MetricsCube:
+    """
+    Contagens pré-agregadas por ano × dimensão, calculadas uma vez por atualização dos dados.
+    As páginas consultam números e DataFrames tidy daqui; as linhas brutas ficam só para
+    detalhamentos. Dimensões ausentes num ano levantam KeyError, como a coluna faltante levantaria.
+    """
+
+    def __init__(self, frames: dict):
+        self.totals = {ano: len(df) for ano, df in frames.items()}
+        self._counts = {}
+        self._tags = {}
+        self._means = {}
+        self._blanks = {}
+        for ano, df in frames.items():
+            for col in BLANK_COLUMNS:
+                if col in df.columns:
+                    self._blanks[ano, col] = int((df[col].isna() | (df[col] == "")).sum())
+            for col in MEAN_COLUMNS:
+                if col in df.columns:
+                    self._means[ano, col] = float(df[col].mean())
+            for dim in DIMENSIONS:
+                if dim in df.columns:
+                    self._counts[ano, dim] = df[dim].value_counts()
+            for dim in FLAG_DIMENSIONS:
+                if dim in df.columns:
+                    self._counts[ano, dim] = NORM_FLAG.value_counts(df[dim])
+            for dim in TAG_DIMENSIONS:
+                if dim in df.columns:
+                    self._tags[ano, dim] = TagIndex.from_series(df[dim])
+                    self._counts[ano, dim] = self._tags[ano, dim].counts()
+
+    def counts(self, ano: str, dim: str) -> pd.Series:
+        """Contagens por valor em ordem decrescente (como value_counts)."""
+        return self._counts[ano, dim]
+
+    def tags(self, ano: str, dim: str) -> TagIndex:
+        """Índice de tags de uma dimensão multivalorada, alinhado às linhas da edição (filtros `has`)."""
+        return self._tags[ano, dim]
+
+    def count(self, ano: str, dim: str, values) -> int:
+        """Total de linhas cujo valor está em `values` (um valor ou uma lista)."""
+        values = values if isinstance(values, list) else [values]
+        return int(self.counts(ano, dim).reindex(values, fill_value=0).sum())
+
+    def pct(self, ano: str, dim: str, values) -> float:
+        """Percentual sobre todas as linhas do ano (inclusive as sem resposta)."""
+        return self.count(ano, dim, values) / self.totals[ano] * 100
+
+    def count_if(self, ano: str, dim: str, predicate) -> int:
+        """Total de linhas cujo valor satisfaz `predicate` (aplicado ao Index de valores distintos)."""
+        c = self.counts(ano, dim)
+        mask = predicate(pd.Index(c.index, dtype=object).astype(str))
+        return int(c[np.asarray(mask, dtype=bool)].sum())
+
+    def mean(self, ano: str, col: str) -> float:
+        """Média (sem nulos) de uma coluna de MEAN_COLUMNS."""
+        return self._means[ano, col]
+
+    def blank(self, ano: str, col: str) -> int:
+        """Linhas sem resposta (nulo ou texto vazio) numa coluna de BLANK_COLUMNS."""
+        return self._blanks[ano, col]
+
+    def share(self, ano: str, dim: str) -> pd.Series:
+        """Proporção de cada valor entre as respostas não nulas (value_counts(normalize=True))."""
+        c = self.counts(ano, dim)
+        return c / c.sum()
+
+    def nunique(self, ano: str, dim: str) -> int:
+        return len(self.counts(ano, dim))
+
+    def tidy(self, dim: str, anos: list, normalize: bool = False,
+             name: str = "n", label: str = None) -> pd.DataFrame:
+        """DataFrame tidy (`label`, `name`, ano) empilhando os anos, pronto para o plotly."""
+        label = label or dim
+        parts = [
+            (self.share(ano, dim) if normalize else self.counts(ano, dim))
+            .rename_axis(label)
+            .reset_index(name=name)
+            .assign(ano=ano)
+            for ano in anos
+        ]
+        return pd.concat(parts, ignore_index=True)
+
+
+@st.cache_resource(max_entries=2)
+def _cube(versions: tuple) -> MetricsCube:
+    return MetricsCube(load_editions([ano for ano, _ in versions]))
+
+
+def load_cube() -> MetricsCube:
+    """
+    Cubo de métricas de todas as edições registradas (utils/editions.py), compartilhado pelo
+    processo e reconstruído uma vez a cada nova versão dos dados.
+    """
+    return _cube(edition_versions())
@@ -0,0 +1,87 @@
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+# Limite de valores memorizados por normalizador (colunas livres têm centenas, não milhares)
+MAX_MEMO = 100_000
+
+
+def fold_accents(s: str) -> str:
+    """Remove acentos (NFKD + descarte das marcas combinantes)."""
+    return "".join(c for c in unicodedata.normalize("NFKD", s) if not unicodedata.combining(c))
+
+
+_STEPS = {
+    "strip": str.strip,
+    "lower": str.lower,
+    "upper": str.upper,
+    "title": str.title,
+    "collapse_ws": lambda s: re.sub(r"\s+", " ", s),
+    "fold_accents": fold_accents,
+}
+
+
+class Normalizer:
+    """
+    Canonização de uma coluna de texto livre aplicada só aos valores distintos: a série é
+    fatorada, cada valor distinto passa pelas etapas (`steps`: nomes de _STEPS ou funções
+    str -> str) e o resultado volta às linhas pelos códigos. Com `synonyms`, o valor
+    canonizado é trocado pelo sinônimo cuja chave coincide sem acento e sem caixa; valores
+    sem sinônimo ficam como estão (`keep_unmapped=True`) ou viram NaN. Nulos continuam nulos.
+    Os resultados ficam memorizados na instância, valendo entre anos e atualizações dos dados.
+    """
+
+    def __init__(self, steps: tuple, synonyms: dict = None, keep_unmapped: bool = True):
+        self.steps = [_STEPS[s] if isinstance(s, str) else s for s in steps]
+        self.synonyms = {self._key(k): v for k, v in (synonyms or {}).items()}
+        self.keep_unmapped = keep_unmapped
+        self._memo = {}
+
+    @staticmethod
+    def _key(s: str) -> str:
+        return fold_accents(s).lower()
+
+    def canon(self, value):
+        """Forma canônica de um único valor."""
+        out = str(value)
+        for step in self.steps:
+            out = step(out)
+            if out is None:
+                return None
+        if self.synonyms:
+            mapped = self.synonyms.get(self._key(out))
+            if mapped is not None or not self.keep_unmapped:
+                return mapped
+        return out
+
+    def _factor(self, s: pd.Series):
+        # códigos por linha e rótulo canônico de cada valor distinto (+ NaN na última posição)
+        codes, uniques = pd.factorize(s)
+        memo = self._memo
+        if len(memo) > MAX_MEMO:
+            memo.clear()
+        labels = np.empty(len(uniques) + 1, dtype=object)
+        for i, u in enumerate(uniques):
+            if u not in memo:
+                memo[u] = self.canon(u)
+            labels[i] = memo[u]
+        labels[-1] = np.nan
+        labels[pd.isna(labels)] = np.nan
+        return codes, labels
+
+    def __call__(self, s: pd.Series) -> pd.Series:
+        codes, labels = self._factor(s)
+        # o código -1 (nulo) pega a última posição; o take roda sobre os rótulos já tipados
+        out = pd.Series(labels).take(codes)
+        out.index = s.index
+        return out.rename(s.name)
+
+    def value_counts(self, s: pd.Series) -> pd.Series:
+        """Equivale a `self(s).value_counts()`, contando pelos códigos sem materializar a coluna."""
+        codes, labels = self._factor(s)
+        n = np.bincount(codes[codes >= 0], minlength=len(labels) - 1)
+        c = pd.Series(n, index=pd.Index(labels[:-1], dtype=object))
+        c = c[c.index.notna()].groupby(level=0, sort=False).sum()
+        return c[c > 0].sort_values(ascending=False, kind="stable").rename("count")
@@ -0,0 +1,159 @@
+import streamlit as st
+import pandas as pd
+import re
+import numpy as np
+from utils.data_loader import build_data, load_data
+from utils.refresher import BackgroundRefresher
+from utils import snapshot
+from utils.ages import AGE_LABELS, age_bands, compute_idade_anos
+from utils.normalize import Normalizer
+from utils.tags import TagIndex
+
+# Copy-on-Write: visões rasas do DataFrame compartilhado (load_shared) nunca alteram o
+# original, mesmo que a página atribua colunas. No pandas >= 3 é sempre o comportamento.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Datas de início das inscrições de cada edição
+START_2024 = pd.Timestamp('2024-07-04 17:30:00')
+START_2025 = pd.Timestamp('2025-06-12 08:00:00')
+
+VALID_STATES = [
+    'AC','AL','AP','AM','BA','CE','DF','ES','GO','MA','MT','MS','MG',
+    'PA','PB','PR','PE','PI','RJ','RN','RS','RO','RR','SC','SP','SE','TO'
+]
+REGION_MAP = {
+    'AC':'Norte','AP':'Norte','AM':'Norte','PA':'Norte','RO':'Norte','RR':'Norte','TO':'Norte',
+    'CE':'Nordeste','MA':'Nordeste','PB':'Nordeste','PE':'Nordeste','PI':'Nordeste','RN':'Nordeste','SE':'Nordeste','AL':'Nordeste','BA':'Nordeste',
+    'ES':'Sudeste','MG':'Sudeste','RJ':'Sudeste','SP':'Sudeste',
+    'PR':'Sul','SC':'Sul','RS':'Sul',
+    'DF':'Centro-Oeste','GO':'Centro-Oeste','MT':'Centro-Oeste','MS':'Centro-Oeste'
+}
+
+# Escolaridade: 5 categorias principais (para KPIs)
+ESCOLARIDADE_MAP = {
+    'ensino básico em andamento': 'Ensino Básico',
+    'ensino básico completo': 'Ensino Básico',
+    'ensino médio completo': 'Ensino Médio',
+    'ensino médio em andamento': 'Ensino Médio',
+    'ensino superior completo': 'Ensino Superior',
+    'ensino superior em andamento': 'Ensino Superior',
+    'pós graduação completa': 'Pós Graduação',
+    'pós graduação em andamento': 'Pós Graduação',
+    'mestrado': 'Mestrado',
+    'doutorado': 'Doutorado'
+}
+
+COL_GEN  = "Com qual gênero você se identifica?"
+COL_HIST = "Participou de algum RNP anterior? Se sim, quais as edições?"
+
+
+def _genero_cat(g: str):
+    # apenas Masculino / Feminino
+    if re.search(r'feminino|mulher', g):
+        return 'Feminino'
+    if re.search(r'masculino|homem', g):
+        return 'Masculino'
+    return None
+
+
+# Normalizadores das colunas de texto livre (aplicados aos valores distintos, ver utils/normalize.py)
+NORM_ESTADO = Normalizer(("strip", "upper"))
+NORM_CIDADE = Normalizer(("strip", "title"))
+NORM_GENERO = Normalizer(("lower", _genero_cat))
+NORM_ESCOLARIDADE = Normalizer(("strip", "lower", "collapse_ws"), synonyms=ESCOLARIDADE_MAP, keep_unmapped=False)
+NORM_ESCOLARIDADE_RAW = Normalizer(("strip", "lower", "collapse_ws", "title"))
+# respostas Sim/Não (contadas no cubo de métricas)
+NORM_FLAG = Normalizer(("strip", "lower"))
+
+
+def categorize_hist(hist: pd.Series) -> np.ndarray:
+    # categoriza número de edições anteriores (contadas no índice de tags, sem parse por linha)
+    n = TagIndex.from_series(hist).n_tags()
+    return np.select(
+        [n == 0, n == 1, n <= 3],
+        ["Primeira vez", "1 edição anterior", "2–3 edições"],
+        default="4+ edições",
+    ).astype(object)
+
+
+def derive_demografia(df: pd.DataFrame, start: pd.Timestamp) -> pd.DataFrame:
+    """Demografia: idade_anos, idade, faixa, hist_cat e genero_cat."""
+    df['idade_anos'] = compute_idade_anos(df['Data de nascimento'], start)
+    df['idade'], df['faixa'] = age_bands(df['idade_anos'])
+    df['hist_cat'] = categorize_hist(df[COL_HIST])
+    df['genero_cat'] = NORM_GENERO(df[COL_GEN])
+    return df
+
+
+def derive_geografico(df: pd.DataFrame) -> pd.DataFrame:
+    """Geográfico: estado_proc, Região e Cidade_proc."""
+    df['estado_proc'] = NORM_ESTADO(df['Estado'])
+    df['Região'] = df['estado_proc'].map(REGION_MAP)
+    df['Cidade_proc'] = NORM_CIDADE(df['Cidade'])
+    return df
+
+
+def derive_educacao(df: pd.DataFrame) -> pd.DataFrame:
+    """Educação: Escolaridade_proc (5 categorias) e Escolaridade_raw."""
+    df['Escolaridade_proc'] = NORM_ESCOLARIDADE(df['Escolaridade'])
+    # mantém cada categoria separada, apenas padroniza capitalização
+    df['Escolaridade_raw'] = NORM_ESCOLARIDADE_RAW(df['Escolaridade'])
+    return df
+
+
+def add_derived_columns(df: pd.DataFrame, start: pd.Timestamp) -> pd.DataFrame:
+    """Colunas derivadas usadas pelas páginas, calculadas uma única vez (todas as etapas acima)."""
+    df = derive_demografia(df, start)
+    df = derive_geografico(df)
+    return derive_educacao(df)
+
+
+@st.cache_resource(ttl=600)
+def _shared_prepared(path: str, start: pd.Timestamp, version: str) -> pd.DataFrame:
+    # `version` (ver `data_version`) na chave: dados e versão do CSV mudam juntos
+    return add_derived_columns(load_data(path=path, version=version), start)
+
+
+@st.cache_resource
+def api_refresher(edition: str, endpoint: str, start: pd.Timestamp) -> BackgroundRefresher:
+    """
+    Atualizador em segundo plano (um por edição e processo) dos dados da API já preparados.
+    A chave do cache são os argumentos passados, então nenhum tem padrão: toda chamada
+    informa a edição, o segredo da URL e a data de início (ver utils/editions.py).
+    Usa a sincronização incremental: a maioria das recargas busca só os participantes
+    novos e, periodicamente, uma paginação completa atualiza os já conhecidos.
+    """
+    return BackgroundRefresher(
+        lambda: add_derived_columns(
+            build_data(path=None, incremental=True, edition=edition, endpoint=endpoint), start
+        ),
+        interval=600,
+        name=f"api-refresher-{edition}",
+    )
+
+
+def data_version(path: str = None, start: pd.Timestamp = START_2025,
+                 edition: str = None, endpoint: str = "URL") -> str:
+    """Identifica a versão dos dados: edição + momento da última carga da API ou CSV + tamanho + mtime."""
+    if not path:
+        as_of = api_refresher(edition, endpoint, start).as_of
+        return f"api:{edition}:{as_of.isoformat() if as_of else ''}"
+    return snapshot.source_key(path)
+
+
+def load_shared(path: str = None, start: pd.Timestamp = START_2025,
+                edition: str = None, endpoint: str = "URL") -> pd.DataFrame:
+    """
+    `load_data` + colunas derivadas (ver `add_derived_columns`) sem cópia por rerun: o
+    DataFrame preparado é uma única instância por processo (st.cache_resource) e cada
+    chamada recebe uma visão rasa dele; `start` é o início das inscrições (referência da idade).
+    Com Copy-on-Write, alterar a visão (ex.: criar colunas) copia só o que foi alterado
+    e nunca afeta as outras sessões; o custo por rerun não depende do tamanho dos dados.
+    Os dados da API vêm do `api_refresher` da edição (`edition`, `endpoint`): a página
+    recebe sempre a última versão boa e nunca espera a API (exceto na primeira carga do
+    processo). Use via utils/editions.py, que passa sempre os mesmos argumentos.
+    """
+    if not path:
+        return api_refresher(edition, endpoint, start).get().copy(deep=False)
+    return _shared_prepared(path, start, data_version(path, start)).copy(deep=False)
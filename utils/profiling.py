@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+import time
+
+import streamlit as st
+import plotly.io as pio
+
+# Relatório contínuo: uma linha JSON por execução de página, mantidas só as últimas MAX_RUNS
+PROFILE_DIR = "./dados/.profile"
+PROFILE_FILE = os.path.join(PROFILE_DIR, "render.jsonl")
+MAX_RUNS = 1000
+
+_lock = threading.Lock()
+
+
+def profiling_enabled() -> bool:
+    """Perfil de renderização ligado por `PROFILE_PAGES = true` em st.secrets ou pela env DASHBOARD_PROFILE=1."""
+    return bool(st.secrets.get("PROFILE_PAGES", False)) or os.environ.get("DASHBOARD_PROFILE") == "1"
+
+
+class PageProfiler:
+    """
+    Perfil opcional de uma execução de página. Divide o tempo em preparação de dados,
+    construção de figuras, serialização e envio ao Streamlit, e registra o tamanho
+    serializado de cada figura e bloco de markdown.
+
+    - `lap(categoria)`: atribui à categoria ("dados" ou "figuras") o tempo desde a marca anterior;
+    - `plotly_chart` / `markdown`: substituem st.plotly_chart / st.markdown;
+    - `finish()`: acrescenta o registro da execução em PROFILE_FILE.
+
+    Desligado (padrão), cada método apenas repassa a chamada ao Streamlit.
+    """
+
+    def __init__(self, page: str, enabled: bool = None):
+        self.page = page
+        self.enabled = profiling_enabled() if enabled is None else enabled
+        self.started = time.perf_counter()
+        self._mark = self.started
+        self.tempos = {"dados": 0.0, "figuras": 0.0, "serializacao": 0.0, "envio": 0.0}
+        self.elementos = []
+
+    def lap(self, categoria: str) -> None:
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.tempos[categoria] = self.tempos.get(categoria, 0.0) + now - self._mark
+        self._mark = now
+
+    def plotly_chart(self, fig, nome: str = None, **kwargs):
+        if not self.enabled:
+            return st.plotly_chart(fig, **kwargs)
+        self.lap("figuras")
+        t0 = time.perf_counter()
+        payload = pio.to_json(fig, validate=False)
+        t1 = time.perf_counter()
+        out = st.plotly_chart(fig, **kwargs)
+        t2 = time.perf_counter()
+        self.tempos["serializacao"] += t1 - t0
+        self.tempos["envio"] += t2 - t1
+        self.elementos.append({
+            "tipo": "figura",
+            "nome": nome or fig.layout.title.text,
+            "bytes": len(payload.encode("utf-8")),
+            "serializacao_s": round(t1 - t0, 4),
+            "envio_s": round(t2 - t1, 4),
+        })
+        self._mark = t2
+        return out
+
+    def markdown(self, body: str, **kwargs):
+        if not self.enabled:
+            return st.markdown(body, **kwargs)
+        self.lap("dados")
+        t0 = time.perf_counter()
+        out = st.markdown(body, **kwargs)
+        t1 = time.perf_counter()
+        self.tempos["envio"] += t1 - t0
+        self.elementos.append({"tipo": "markdown", "bytes": len(body.encode("utf-8")),
+                               "envio_s": round(t1 - t0, 4)})
+        self._mark = t1
+        return out
+
+    def finish(self) -> dict:
+        """Fecha a execução (o resto vai para "dados") e grava o registro no relatório."""
+        if not self.enabled:
+            return {}
+        self.lap("dados")
+        record = {
+            "pagina": self.page,
+            "em": time.time(),
+            "total_s": round(time.perf_counter() - self.started, 4),
+            "tempos_s": {k: round(v, 4) for k, v in self.tempos.items()},
+            "bytes_figuras": sum(e["bytes"] for e in self.elementos if e["tipo"] == "figura"),
+            "bytes_markdown": sum(e["bytes"] for e in self.elementos if e["tipo"] == "markdown"),
+            "elementos": self.elementos,
+        }
+        _append(record)
+        return record
+
+
+def _append(record: dict) -> None:
+    # mantém o relatório limitado às últimas MAX_RUNS execuções (troca atômica do arquivo)
+    with _lock:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        lines = []
+        if os.path.exists(PROFILE_FILE):
+            with open(PROFILE_FILE, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        lines = lines[-(MAX_RUNS - 1):] + [json.dumps(record, ensure_ascii=False)]
+        tmp = PROFILE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, PROFILE_FILE)
+
+
+def load_report(page: str = None) -> list:
+    """Registros do relatório (opcionalmente só de uma página), do mais antigo ao mais recente."""
+    if not os.path.exists(PROFILE_FILE):
+        return []
+    with open(PROFILE_FILE, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return [r for r in records if page is None or r["pagina"] == page]
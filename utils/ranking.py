@@ -0,0 +1,53 @@
+from html import escape
+
+import pandas as pd
+
+
+def ranking_frame(atual: pd.Series, anterior: pd.Series, n: int = 10) -> pd.DataFrame:
+    """
+    Top `n` de `atual` (contagens ordenadas) com a variação % sobre `anterior`, no formato
+    tidy esperado por `ranking_html` (delta NaN quando o item não existia antes).
+    """
+    top = atual.head(n)
+    base = anterior.reindex(top.index).fillna(0)
+    delta = ((top - base) / base * 100).where(base > 0)
+    return pd.DataFrame({"label": top.index, "count": top.to_numpy(), "delta": delta.to_numpy()})
+
+
+def _delta_html(delta, suffix: str) -> str:
+    if delta is None or pd.isna(delta):
+        return f"<span style='color:black'>–</span>{suffix}"
+    color = "green" if delta >= 0 else "red"
+    return f"<span style='color:{color}'>{delta:+.1f}%</span>{suffix}"
+
+
+def ranking_html(df: pd.DataFrame, n: int = 10, label: str = "label", count: str = "count",
+                 delta: str = "delta", unit: str = "participantes", delta_suffix: str = "",
+                 bar: bool = False) -> str:
+    """
+    Ranking (posição, rótulo, contagem, variação colorida e, opcional, barra proporcional)
+    montado como um único bloco HTML a partir de um DataFrame tidy já ordenado, com as
+    colunas `label`, `count` e `delta` (variação em %, NaN quando não há base de comparação).
+    Um só elemento no lugar de 3–4 st.columns e vários st.markdown/st.progress por linha.
+    """
+    top = df.head(n)
+    max_count = top[count].max() if len(top) else 0
+    grid = "0.5fr 4fr 1fr 3fr" if bar else "0.5fr 4fr 1fr"
+    rows = []
+    for i, (lab, qtd, dlt) in enumerate(zip(top[label], top[count], top[delta]), start=1):
+        cells = [
+            f"<div><b>{i}</b></div>",
+            f"<div><b>{escape(str(lab))}</b><br>{int(qtd)} {unit}</div>",
+            f"<div>{_delta_html(dlt, delta_suffix)}</div>",
+        ]
+        if bar:
+            width = qtd / max_count * 100 if max_count else 0
+            cells.append(
+                "<div><div style='background:rgba(151,166,195,0.25);border-radius:4px;height:0.6rem;margin-top:0.4rem'>"
+                f"<div style='background:#0066CC;border-radius:4px;height:100%;width:{width:.1f}%'></div></div></div>"
+            )
+        rows.append(
+            f"<div style='display:grid;grid-template-columns:{grid};gap:1rem;"
+            f"align-items:center;padding:0.35rem 0'>{''.join(cells)}</div>"
+        )
+    return "<div>" + "".join(rows) + "</div>"
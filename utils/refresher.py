@@ -0,0 +1,100 @@
+import logging
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """
+    Stale-while-revalidate: uma thread recarrega o valor a cada `interval` segundos
+    enquanto os leitores recebem sempre o último valor bom, sem esperar a recarga.
+    Recargas são single-flight (um lock impede duas ao mesmo tempo) e a troca do valor
+    é atômica (uma única atribuição). Só a primeira leitura espera, pois ainda não há dado.
+    Há no máximo uma thread viva por `name`: criar outra instância com o mesmo nome (ex.:
+    quando o st.cache_resource que a guarda é limpo ou expira) para a anterior, e `stop()`
+    encerra o laço sem esperar o intervalo.
+    """
+
+    # instância ativa por nome (ver `__init__`)
+    _live = {}
+    _live_lock = threading.Lock()
+
+    def __init__(self, loader, interval: float = 600, name: str = "refresher"):
+        self._loader = loader
+        self.interval = interval
+        self.name = name
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._state = (None, None)   # (valor, "data as of")
+        self.last_duration = None
+        self.last_error = None
+        with BackgroundRefresher._live_lock:
+            previous = BackgroundRefresher._live.get(name)
+            BackgroundRefresher._live[name] = self
+        if previous is not None:
+            previous.stop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Encerra a thread após a recarga em andamento (se houver); o último valor continua legível."""
+        self._stop.set()
+        with BackgroundRefresher._live_lock:
+            if BackgroundRefresher._live.get(self.name) is self:
+                del BackgroundRefresher._live[self.name]
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def refresh(self) -> bool:
+        """Recarrega agora, se nenhuma recarga estiver em andamento. Retorna False se já havia uma."""
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            t0 = time.perf_counter()
+            value = self._loader()
+            self._state = (value, datetime.now())
+            self.last_duration = time.perf_counter() - t0
+            self.last_error = None
+        except Exception as e:
+            # mantém o último valor bom; o erro fica visível em `status`
+            self.last_error = repr(e)
+            logger.exception("Falha ao atualizar os dados em segundo plano")
+        finally:
+            self._lock.release()
+            self._ready.set()
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            # sem nenhum valor bom ainda, tenta de novo logo em vez de esperar o intervalo todo
+            self._stop.wait(self.interval if self._state[0] is not None else min(30, self.interval))
+
+    @property
+    def refreshing(self) -> bool:
+        return self._lock.locked()
+
+    @property
+    def as_of(self):
+        return self._state[1]
+
+    def get(self, timeout: float = None):
+        """Último valor bom. Só bloqueia até a primeira carga terminar."""
+        self._ready.wait(timeout)
+        value, _ = self._state
+        if value is None:
+            raise RuntimeError(f"Dados ainda indisponíveis: {self.last_error or 'primeira carga em andamento'}")
+        return value
+
+    def status(self) -> dict:
+        return {
+            "as_of": self.as_of,
+            "last_duration_s": self.last_duration,
+            "last_error": self.last_error,
+            "refreshing": self.refreshing,
+        }
@@ -0,0 +1,76 @@
+import re
+import unicodedata
+
+import pandas as pd
+
+# Header desejado dos DataFrames de participantes (ordem do export oficial)
+HEADER_STR = """
+"Email";"Tipo de ingresso";"Nome na credencial";"Nome";"QR Code";"Status do E-mail";
+"Data Inscrição";"Telefone";"País";"Estado";"Cidade";"CPF";"Passaporte";"Data de nascimento";
+"Com qual gênero você se identifica?";"Participou de algum RNP anterior? Se sim, quais as edições?";"Escolaridade";
+"Temas de interesse";"Qual a sua principal área de atuação?";"Você é professor?";"Em qual empresa você trabalha?";
+"Trabalha com tecnologia?";"A empresa em que você trabalha faz parte do Porto Digital?";
+"Você desenvolve alguma atividade empresarial?";"Já foi atendido pelo Sebrae?"
+"""
+DESIRED_COLUMNS = [c.strip('"') for c in HEADER_STR.strip().replace("\n","").split(";")]
+
+# Tipos de leitura do CSV por coluna desejada. Tudo é texto: CPF, Telefone e QR Code
+# perderiam zeros à esquerda se inferidos como número, e datas são parseadas nas páginas.
+CSV_DTYPES = {c: "str" for c in DESIRED_COLUMNS}
+
+
+def norm_col(s: str) -> str:
+    """Forma normalizada de um nome de coluna: sem acento, sem pontuação, minúscula."""
+    s = unicodedata.normalize("NFKD", s).encode("ascii","ignore").decode()
+    return re.sub(r"\W+","", s).lower()
+
+
+# Colunas de baixa cardinalidade guardadas como category no modo compacto
+CATEGORY_COLUMNS = [
+    "Tipo de ingresso", "Status do E-mail", "País", "Estado", "Cidade",
+    "Com qual gênero você se identifica?", "Escolaridade", "Qual a sua principal área de atuação?",
+]
+# Perguntas Sim/Não guardadas como boolean (nullable) no modo compacto
+BOOLEAN_COLUMNS = [
+    "Você é professor?", "Trabalha com tecnologia?",
+    "A empresa em que você trabalha faz parte do Porto Digital?",
+    "Você desenvolve alguma atividade empresarial?", "Já foi atendido pelo Sebrae?",
+]
+_YES_NO = {"sim": True, "s": True, "nao": False, "não": False, "n": False}
+
+
+def _canon_labels(s: pd.Series, upper: bool = False) -> pd.Series:
+    # canoniza só os valores distintos: trim e espaços internos colapsados
+    cat = s.astype("category")
+    if len(cat.cat.categories) == 0:
+        return cat.values
+    labels = cat.cat.categories.astype(str).str.strip().str.replace(r"\s+", " ", regex=True)
+    labels = labels.str.upper() if upper else labels
+    return pd.Categorical(labels[cat.cat.codes].where(cat.cat.codes >= 0))
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Representação compacta opcional: colunas de CATEGORY_COLUMNS viram category com rótulos
+    canonizados (Estado em maiúsculas) e as de BOOLEAN_COLUMNS viram boolean quando todas as
+    respostas são Sim/Não (senão ficam como category). A memória antes/depois, em bytes,
+    fica em `df.attrs["memoria"]`.
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    df = df.copy()
+    for c in CATEGORY_COLUMNS:
+        if c in df.columns:
+            df[c] = _canon_labels(df[c], upper=(c == "Estado"))
+    for c in BOOLEAN_COLUMNS:
+        if c not in df.columns:
+            continue
+        cat = _canon_labels(df[c])
+        mapped = pd.Series(cat.categories.str.lower()).map(_YES_NO)
+        if mapped.notna().all():
+            codes = pd.Series(cat.codes, index=df.index)
+            df[c] = codes.map(dict(enumerate(mapped))).astype("boolean")
+        else:
+            df[c] = cat
+    after = int(df.memory_usage(deep=True).sum())
+    df.attrs["memoria"] = {"antes": before, "depois": after}
+    return df
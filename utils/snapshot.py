@@ -0,0 +1,76 @@
+import hashlib
+import os
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow é opcional: sem ele o snapshot fica desativado
+    pa = feather = None
+
+# Snapshots colunares (Arrow/Feather) do DataFrame já normalizado por load_data.
+# Incremente SCHEMA_VERSION sempre que a normalização mudar o formato ou o conteúdo das colunas
+# (3: parse_day com fallback ISO e dia primeiro).
+SNAPSHOT_DIR = "./dados/.snapshots"
+SCHEMA_VERSION = 3
+
+
+def available() -> bool:
+    return feather is not None
+
+
+def source_key(path: str = None, edition: str = None) -> str:
+    """Identifica a origem: 'api:<edição>' ou o CSV junto com tamanho e data de modificação."""
+    if not path:
+        return f"api:{edition}" if edition else "api"
+    info = os.stat(path)
+    return f"csv:{os.path.abspath(path)}:{info.st_size}:{int(info.st_mtime)}"
+
+
+def snapshot_path(source: str) -> str:
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(SNAPSHOT_DIR, f"v{SCHEMA_VERSION}-{digest}.feather")
+
+
+def _arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    # colunas object com tipos misturados (ex.: str e bool vindos do formFields) viram texto
+    out = df.reset_index(drop=True)
+    for c in out.columns[out.dtypes == object]:
+        kind = pd.api.types.infer_dtype(out[c], skipna=True)
+        if kind.startswith("mixed"):
+            s = out[c]
+            out[c] = s.where(s.isna(), s.astype(str))
+    return out
+
+
+def write_snapshot(df: pd.DataFrame, source: str) -> bool:
+    """Grava o snapshot sem compressão (permite memory-map na leitura). Retorna False sem pyarrow."""
+    if not available():
+        return False
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    dest = snapshot_path(source)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    feather.write_feather(_arrow_safe(df), tmp, compression="uncompressed")
+    os.replace(tmp, dest)
+    return True
+
+
+def read_snapshot(source: str, max_age: float = None):
+    """
+    Lê o snapshot via memory-map. Retorna None se não houver, se pyarrow faltar
+    ou se o arquivo for mais velho que `max_age` segundos.
+    """
+    if not available():
+        return None
+    path = snapshot_path(source)
+    if not os.path.exists(path):
+        return None
+    if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+        return None
+    try:
+        table = feather.read_table(path, memory_map=True)
+    except (OSError, pa.ArrowInvalid):
+        return None
+    return table.to_pandas()
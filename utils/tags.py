@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+
+class TagIndex:
+    """
+    Índice multi-hot esparso de uma coluna com vários valores por resposta separados por
+    vírgula ("Temas de interesse", edições anteriores): vocabulário de tags e, por linha,
+    os ids das suas tags em formato CSR (`indptr` × `indices`). Cada texto distinto é
+    quebrado uma única vez; contagens e filtros são operações numpy sobre os ids.
+    Tags são comparadas após strip; vazias são descartadas e repetidas na mesma linha contam uma vez.
+    """
+
+    def __init__(self, vocab: list, indptr: np.ndarray, indices: np.ndarray):
+        self.vocab = vocab
+        self.ids = {t: i for i, t in enumerate(vocab)}
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def from_series(cls, series: pd.Series, sep: str = ",") -> "TagIndex":
+        codes, uniques = pd.factorize(series)
+        ids = {}
+        per_unique = []
+        for u in uniques:
+            row = [ids.setdefault(t, len(ids)) for t in (p.strip() for p in str(u).split(sep)) if t]
+            per_unique.append(list(dict.fromkeys(row)))
+        # tags de cada texto distinto concatenadas; a posição extra no fim é a das linhas nulas (código -1)
+        u_len = np.array([len(r) for r in per_unique] + [0], dtype=np.int64)
+        u_start = np.concatenate([[0], np.cumsum(u_len)[:-1]])
+        u_flat = np.fromiter((i for r in per_unique for i in r), dtype=np.int32, count=int(u_len.sum()))
+
+        row_len = u_len[codes]
+        indptr = np.concatenate([[0], np.cumsum(row_len)])
+        gather = np.repeat(u_start[codes] - indptr[:-1], row_len) + np.arange(indptr[-1])
+        return cls(list(ids), indptr, u_flat[gather])
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def n_tags(self) -> np.ndarray:
+        """Número de tags de cada linha."""
+        return np.diff(self.indptr)
+
+    def counts(self) -> pd.Series:
+        """Linhas por tag, em ordem decrescente (como value_counts após o explode)."""
+        c = np.bincount(self.indices, minlength=len(self.vocab))
+        s = pd.Series(c, index=pd.Index(self.vocab, dtype=object), name="count")
+        return s[s > 0].sort_values(ascending=False, kind="stable")
+
+    def has(self, tags) -> np.ndarray:
+        """Máscara booleana das linhas que têm alguma das `tags` (uma tag ou uma lista)."""
+        tags = tags if isinstance(tags, list) else [tags]
+        wanted = [self.ids[t] for t in tags if t in self.ids]
+        mask = np.zeros(len(self), dtype=bool)
+        if wanted:
+            rows = np.repeat(np.arange(len(self)), self.n_tags())
+            mask[rows[np.isin(self.indices, wanted)]] = True
+        return mask
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+# Horário de Brasília (America/Sao_Paulo): UTC-3 fixo desde o fim do horário de verão em 2019
+LOCAL_OFFSET_MS = -3 * 3600 * 1000
+MS_HOUR = 3600 * 1000
+MS_DAY = 24 * MS_HOUR
+DIAS_SEMANA = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+
+
+def time_keys(created_ms: np.ndarray):
+    """
+    Chaves inteiras de tempo local a partir de `createdAt_ms` (ms UTC), só com aritmética
+    inteira: (dia desde 1970-01-01, hora 0–23, dia da semana 0=segunda … 6=domingo).
+    """
+    local = np.asarray(created_ms, dtype=np.int64) + LOCAL_OFFSET_MS
+    dia = local // MS_DAY
+    hora = ((local - dia * MS_DAY) // MS_HOUR).astype(np.int8)
+    # 1970-01-01 foi uma quinta-feira (3 com segunda = 0)
+    dia_semana = ((dia + 3) % 7).astype(np.int8)
+    return dia, hora, dia_semana
+
+
+def parse_day(s: pd.Series, fmt: str = "%d/%m/%Y") -> pd.Series:
+    """
+    Texto de data (ex.: 'Data Inscrição') para datetime64 (dia); só os valores distintos
+    são parseados. Primeiro com o formato explícito (hora anexada é ignorada); o que falhar
+    é tentado como data ISO (aaaa-mm-dd) e, por fim, valor a valor com dia primeiro
+    ("5/7/2024 10:00"), como o parse antigo com dayfirst=True. O resto vira NaT.
+    """
+    codes, uniques = pd.factorize(s)
+    text = pd.Index(uniques, dtype=object).astype(str)
+    parsed = pd.to_datetime(text.str.slice(0, 10), format=fmt, errors="coerce")
+    fallbacks = (
+        lambda t: pd.to_datetime(t.str.slice(0, 10), format="%Y-%m-%d", errors="coerce"),
+        lambda t: pd.to_datetime(t, format="mixed", dayfirst=True, utc=True, errors="coerce").tz_localize(None),
+    )
+    for fallback in fallbacks:
+        bad = np.asarray(parsed.isna())
+        if not bad.any():
+            break
+        values = parsed.to_numpy(dtype="datetime64[ns]", copy=True)
+        values[bad] = fallback(text[bad]).normalize().to_numpy(dtype="datetime64[ns]")
+        parsed = pd.DatetimeIndex(values)
+    out = parsed.take(codes, allow_fill=True, fill_value=pd.NaT) if len(parsed) else \
+        pd.DatetimeIndex(np.full(len(codes), np.datetime64("NaT"), dtype="datetime64[ns]"))
+    return pd.Series(out, index=s.index, name=s.name)
+
+
+def heatmap_dia_hora(created_ms: np.ndarray) -> pd.DataFrame:
+    """Inscrições por dia da semana × hora (7 × 24) por contagem direta das chaves inteiras."""
+    ms = np.asarray(created_ms)
+    ms = ms[~pd.isna(ms)].astype(np.int64)
+    _, hora, dia_semana = time_keys(ms)
+    counts = np.bincount(dia_semana.astype(np.int64) * 24 + hora, minlength=7 * 24)
+    return pd.DataFrame(counts.reshape(7, 24), index=DIAS_SEMANA, columns=range(24))